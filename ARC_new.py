@@ -1,21 +1,1882 @@
-import pandas as pd
 import os
-from datetime import datetime, timedelta
+import csv
+from datetime import datetime, timedelta, timezone
 import json
 import re
 from collections import defaultdict, Counter
-import requests
-from bs4 import BeautifulSoup
 import time
-import feedparser
-from urllib.parse import quote_plus
+import hashlib
+import threading
+import sqlite3
+import signal
+import sys
+import argparse
+import gzip
+import zlib
+import email.utils
+import html
+from array import array
+from contextlib import contextmanager
+import functools
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from urllib.parse import quote_plus, urlparse
+
+# pandas, requests, feedparser, bs4 and lxml are imported inside the stages
+# that use them, so the CLI (--help, listing sources, ...) starts instantly.
+
+
+@functools.lru_cache(maxsize=None)
+def _lxml_html():
+    """lxml.html if installed, else None (imported once, on first use)"""
+    try:
+        import lxml.html
+    except ImportError:  # Fall back to BeautifulSoup's built-in parser
+        return None
+    return lxml.html
+
+
+def _pooled_session(pool_size, user_agent=None):
+    """requests.Session with a connection pool sized for pool_size workers"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if user_agent:
+        session.headers['User-Agent'] = user_agent
+    return session
+
+# Word tokens used for all phrase matching (keywords and contact names)
+_TOKEN_RE = re.compile(r"\w+")
+
+# A single letter followed by "." ("j. smith"), written as an initial whatever its case
+_DOTTED_INITIAL_RE = re.compile(r"(?<!\w)\w\.")
+
+
+def tokenize(text):
+    """Split text into lowercase word tokens"""
+    return _TOKEN_RE.findall(text.lower()) if text else []
+
+
+def capitalized_positions(*texts):
+    """Indexes into the tokens of texts (tokenized in turn) of tokens written
+    like part of a name: capitalized ("Bill", "J") or a single letter
+    followed by "." ("j. smith")"""
+    positions = set()
+    index = 0
+    for text in texts:
+        if not text:
+            continue
+        if _DOTTED_INITIAL_RE.search(text):
+            for match in _TOKEN_RE.finditer(text):
+                token = match.group()
+                if token[0].isupper() or (len(token) == 1 and text.startswith('.', match.end())):
+                    positions.add(index)
+                index += 1
+        else:
+            tokens = _TOKEN_RE.findall(text)
+            positions.update(i for i, token in enumerate(tokens, index) if token[0].isupper())
+            index += len(tokens)
+    return positions
+
+
+class PhraseMatcher:
+    """Match many phrases against a text in a single pass over its tokens.
+
+    Phrases are stored as token tuples in a hash table, so matching costs one
+    walk over the document regardless of how many phrases are registered, and
+    a phrase only matches on whole-word boundaries ("Die" does not hit "diet").
+    """
+
+    def __init__(self):
+        self._phrases = {}  # token tuple -> list of values
+        self._lengths = {}  # first token -> phrase lengths starting with it
+
+    def __len__(self):
+        return len(self._phrases)
+
+    def add(self, phrase, value):
+        """Register a phrase; returns False if it has no word tokens"""
+        return self.add_tokens(tuple(tokenize(phrase)), value)
+
+    def add_tokens(self, key, value):
+        """Register an already tokenized phrase (a tuple of tokens)"""
+        if not key:
+            return False
+        values = self._phrases.setdefault(key, [])
+        if value not in values:
+            values.append(value)
+        lengths = self._lengths.setdefault(key[0], [])
+        if len(key) not in lengths:
+            lengths.append(len(key))
+            lengths.sort()
+        return True
+
+    def find(self, tokens):
+        """Return the set of values whose phrase occurs in the token list"""
+        found = set()
+        phrases = self._phrases
+        lengths = self._lengths
+        n_tokens = len(tokens)
+        for i, token in enumerate(tokens):
+            sizes = lengths.get(token)
+            if sizes is None:
+                continue
+            for size in sizes:
+                if i + size > n_tokens:
+                    break
+                values = phrases.get(tuple(tokens[i:i + size]))
+                if values:
+                    found.update(values)
+        return found
+
+    def iter_matches(self, tokens):
+        """Yield (start, length, values) for every phrase occurrence"""
+        phrases = self._phrases
+        lengths = self._lengths
+        n_tokens = len(tokens)
+        for i, token in enumerate(tokens):
+            sizes = lengths.get(token)
+            if sizes is None:
+                continue
+            for size in sizes:
+                if i + size > n_tokens:
+                    break
+                values = phrases.get(tuple(tokens[i:i + size]))
+                if values:
+                    yield i, size, values
+
+    def keys(self):
+        """The registered phrases as token tuples"""
+        return self._phrases.keys()
+
+
+# Common English given-name variants; each row is one group of equivalent names
+NICKNAME_GROUPS = [
+    "alexander alex alec sandy", "alexandra alex alexa sandra sandy", "albert al bert",
+    "alfred al alf fred", "allan alan al", "andrew andy drew", "anthony tony", "benjamin ben benny",
+    "catherine katherine kathryn kate katie cathy kathy", "charles charlie chuck chas",
+    "christopher chris kit", "christine christina chris tina", "daniel dan danny", "david dave davy",
+    "deborah debra deb debbie", "donald don donny", "douglas doug", "edward ed eddie ted ned",
+    "elizabeth liz beth betsy betty eliza lisa libby", "eugene gene", "frances fran frankie",
+    "francis frank", "frederick fred freddie", "gerald gerry jerry", "gregory greg",
+    "harold hal harry", "henry hank harry", "jacob jake", "james jim jimmy jamie",
+    "jeffrey jeff", "jennifer jen jenny", "jonathan jon", "john jack johnny jon", "joseph joe joey",
+    "joshua josh", "judith judy", "katherine kate katie kathy kat", "kenneth ken kenny",
+    "lawrence larry", "leonard leo len lenny", "margaret maggie meg peggy marge", "matthew matt",
+    "michael mike mikey mick", "nathaniel nathan nate", "nicholas nick nicky", "pamela pam",
+    "patricia pat patty trish", "patrick pat paddy", "peter pete", "philip phil", "rebecca becky becca",
+    "richard rick rich dick richie", "robert bob rob bobby robbie bert", "ronald ron ronnie",
+    "samuel sam sammy", "samantha sam sammy", "stephen steven steve", "susan sue suzy",
+    "theodore ted teddy theo", "thomas tom tommy", "timothy tim timmy", "victoria vicky tori",
+    "walter walt wally", "william bill will billy liam willy", "zachary zach zack",
+]
+
+# Nicknames that are also everyday words ("they will sue Smith"); only
+# matched when they are the contact's actual first name
+_COMMON_WORD_NICKNAMES = frozenset("will sue rob pat chuck kit drew art".split())
+
+# Words that can sit between a first name and a surname without being a middle name
+_NAME_STOPWORDS = frozenset(
+    "a an and as at by for from i in is of on or said says the to told was with".split()
+)
+
+
+def _build_nicknames(groups):
+    """Map each given name to every name it is interchangeable with"""
+    nicknames = {}
+    for group in groups:
+        names = group.split()
+        for name in names:
+            nicknames.setdefault(name, set()).update(names)
+    return nicknames
+
+
+def _within_one_edit(a, b):
+    """True if a and b differ by at most one insertion, deletion or substitution"""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        return a[i + 1:] == b[i + 1:]
+    return a[i:] == b[i + 1:]
+
+
+class ContactNameIndex:
+    """Contact name matcher covering exact names and common variants.
+
+    Exact "First Last" phrases go through a PhraseMatcher. For variants, a
+    blocking index keyed by surname and then by first initial means only
+    contacts whose surname occurs in the article are examined; the tokens
+    just before each surname occurrence are then verified against the
+    contact's first name as an exact match, a nickname ("Bill" for
+    "William"), a one-edit typo (names of fuzzy_min_length+ letters), or an
+    initial ("J. Smith"), with up to max_middle middle names or initials in
+    between. Nicknames, typos and initials only count where the caller
+    lists the token's position in capitalized (see capitalized_positions),
+    so "the Senate bill, Smith said" is not Bill Smith; stopwords ("a",
+    "I") are never initials, and initial-only matches are accepted only
+    when a single contact with that surname has that initial. Possessives ("Smith's") work
+    because tokenization splits off the "s".
+    """
+
+    def __init__(self, variants=True, max_middle=2, fuzzy_min_length=5, nickname_groups=None):
+        self.variants = variants
+        self.max_middle = max_middle
+        self.fuzzy_min_length = fuzzy_min_length
+        self.nicknames = _build_nicknames(NICKNAME_GROUPS if nickname_groups is None else nickname_groups)
+        self.exact = PhraseMatcher()
+        self.surnames = PhraseMatcher()
+        self._blocks = {}  # surname tokens -> first initial -> [(contact id, first name tokens)]
+
+    def __len__(self):
+        return len(self.exact)
+
+    def add(self, contact_id, full_key, first_key=(), last_key=()):
+        """Index a contact by its full name tokens and, if known, first/last name tokens"""
+        added = self.exact.add_tokens(full_key, contact_id)
+        if self.variants and first_key and last_key:
+            self.surnames.add_tokens(last_key, last_key)
+            by_initial = self._blocks.setdefault(last_key, {})
+            # Nicknames can start with a different letter (Bill/William), so
+            # file the contact under the initial of every equivalent name
+            initials = {name[0] for name in self.nicknames.get(first_key[0], ())} | {first_key[0][0]}
+            for initial in initials:
+                by_initial.setdefault(initial, []).append((contact_id, first_key))
+        return added
+
+    def blocking_keys(self):
+        """Token tuples of which at least one occurs in full in any text find() matches"""
+        return list(self.exact.keys()) + list(self.surnames.keys())
+
+    def _first_name_match(self, token, first):
+        """How an article token matches a contact's first name: 'name', 'initial' or None"""
+        if token == first:
+            return 'name'
+        if len(token) == 1:
+            return 'initial' if token == first[0] and token not in _NAME_STOPWORDS else None
+        if token in self.nicknames.get(first, ()) and token not in _COMMON_WORD_NICKNAMES:
+            return 'name'
+        if (len(first) >= self.fuzzy_min_length and token[0] == first[0]
+                and _within_one_edit(token, first)):
+            return 'name'
+        return None
+
+    def _middle_ok(self, middle):
+        """Tokens between first name and surname: initials or one middle name"""
+        if len(middle) > self.max_middle:
+            return False
+        if any(token in _NAME_STOPWORDS or token.isdigit() for token in middle):
+            return False
+        return all(len(token) == 1 for token in middle) or len(middle) <= 1
+
+    def find(self, tokens, capitalized=()):
+        """Return the set of contact ids mentioned in the token list; capitalized
+        holds the positions of tokens written like names (see capitalized_positions)"""
+        found = self.exact.find(tokens)
+        if not self.variants or not self._blocks:
+            return found
+
+        for start, _, last_keys in self.surnames.iter_matches(tokens):
+            by_initial = self._blocks[last_keys[0]]
+            initial_only = set()
+            for first_pos in range(start - 1, max(-1, start - 2 - self.max_middle), -1):
+                token = tokens[first_pos]
+                for contact_id, first_key in by_initial.get(token[0], ()):
+                    if contact_id in found:
+                        continue
+                    kind = self._first_name_match(token, first_key[0])
+                    if kind is None:
+                        continue
+                    if token != first_key[0] and first_pos not in capitalized:
+                        # Variants ("bill", "frank", "j") must be written like a name
+                        continue
+                    end = first_pos + 1
+                    if kind == 'name' and len(first_key) > 1:
+                        # Multi-word first names ("Mary Ann") must appear in full
+                        end = first_pos + len(first_key)
+                        if tuple(tokens[first_pos + 1:end]) != first_key[1:]:
+                            continue
+                    if end > start or not self._middle_ok(tokens[end:start]):
+                        continue
+                    if kind == 'name':
+                        found.add(contact_id)
+                    elif kind == 'initial':
+                        initial_only.add(contact_id)
+            if len(initial_only) == 1:
+                found.update(initial_only)
+        return found
+
+
+def _escape_label(value):
+    """Escape a Prometheus label value"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    """Thread-safe counters, gauges and stage timings for a searcher.
+
+    Every series is identified by a name plus optional labels (e.g.
+    source="CNN"). Timings keep a count, total, max and last duration.
+    snapshot() returns plain JSON-ready data and to_prometheus() renders
+    the Prometheus text exposition format.
+    """
+
+    def __init__(self, prefix='arc'):
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.timings = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return (name, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+    def incr(self, name, value=1, **labels):
+        """Add to a counter"""
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set_gauge(self, name, value, **labels):
+        """Set a gauge to its current value"""
+        with self._lock:
+            self.gauges[self._key(name, labels)] = value
+
+    def observe(self, name, seconds, **labels):
+        """Record one duration for a timing"""
+        key = self._key(name, labels)
+        with self._lock:
+            timing = self.timings.get(key)
+            if timing is None:
+                timing = self.timings[key] = {'count': 0, 'total': 0.0, 'max': 0.0, 'last': 0.0}
+            timing['count'] += 1
+            timing['total'] += seconds
+            timing['max'] = max(timing['max'], seconds)
+            timing['last'] = seconds
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the enclosed block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.gauges.clear()
+            self.timings.clear()
+
+    def snapshot(self):
+        """All metrics as JSON-serializable data"""
+        with self._lock:
+            return {
+                'generated': datetime.now().isoformat(),
+                'counters': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in self.counters.items()],
+                'gauges': [{'name': n, 'labels': dict(l), 'value': v} for (n, l), v in self.gauges.items()],
+                'timings': [{'name': n, 'labels': dict(l), **dict(t)} for (n, l), t in self.timings.items()]
+            }
+
+    def to_prometheus(self):
+        """All metrics in the Prometheus text exposition format"""
+        def series(name, labels, suffix=''):
+            label_text = ','.join(f'{k}="{_escape_label(v)}"' for k, v in labels)
+            return f"{self.prefix}_{name}{suffix}" + (f"{{{label_text}}}" if label_text else '')
+
+        lines = []
+        with self._lock:
+            for kind, metrics in (('counter', self.counters), ('gauge', self.gauges)):
+                for name in sorted({n for n, _ in metrics}):
+                    suffix = '_total' if kind == 'counter' else ''
+                    lines.append(f"# TYPE {self.prefix}_{name}{suffix} {kind}")
+                    for (n, labels), value in sorted(metrics.items()):
+                        if n == name:
+                            lines.append(f"{series(name, labels, suffix)} {value}")
+            for name in sorted({n for n, _ in self.timings}):
+                lines.append(f"# TYPE {self.prefix}_{name}_seconds summary")
+                for (n, labels), timing in sorted(self.timings.items()):
+                    if n == name:
+                        lines.append(f"{series(name, labels, '_seconds_count')} {timing['count']}")
+                        lines.append(f"{series(name, labels, '_seconds_sum')} {timing['total']:.6f}")
+                lines.append(f"# TYPE {self.prefix}_{name}_seconds_max gauge")
+                for (n, labels), timing in sorted(self.timings.items()):
+                    if n == name:
+                        lines.append(f"{series(name, labels, '_seconds_max')} {timing['max']:.6f}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path_prefix='arc_metrics'):
+        """Write <prefix>.json and <prefix>.prom; returns both paths"""
+        json_path, prom_path = f"{path_prefix}.json", f"{path_prefix}.prom"
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        with open(prom_path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        return json_path, prom_path
+
+
+def _normalize_entry(entry):
+    """Reduce a feedparser entry to the plain fields the searcher uses"""
+    published_parsed = entry.get('published_parsed')
+    return {
+        'id': entry.get('id', ''),
+        'title': entry.get('title', ''),
+        'link': entry.get('link', ''),
+        'published': entry.get('published', 'Unknown'),
+        'published_parsed': list(published_parsed) if published_parsed else None,
+        'summary': entry.get('summary', '')
+    }
+
+
+def _utc_now():
+    """Current time as a naive UTC datetime (the form feedparser dates take)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _parse_timestamp(published):
+    """UTC datetime of an RFC 822 or ISO 8601 date string, or None"""
+    if not published or published == 'Unknown':
+        return None
+    try:
+        parsed = email.utils.parsedate_to_datetime(published)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(published.strip().replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _stored_timestamp(published_at, published):
+    """UTC datetime for a stored entry (published_at is naive UTC ISO text)"""
+    if published_at:
+        return datetime.fromisoformat(published_at).replace(tzinfo=timezone.utc)
+    return _parse_timestamp(published)
+
+
+class FeedCache:
+    """On-disk per-feed cache of HTTP validators and parsed entries.
+
+    Each feed is stored as one JSON file holding its ETag / Last-Modified
+    headers and normalized entries, so an unchanged feed (HTTP 304) is served
+    without downloading or parsing it again. Once the cache grows past
+    max_bytes the least recently used feeds are evicted.
+    """
+
+    def __init__(self, cache_dir='feed_cache', max_bytes=50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url):
+        """Return the cached record for a feed URL, or None"""
+        path = self._path(url)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                record = json.load(f)
+            os.utime(path)  # Mark as recently used for eviction
+            return record
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url, etag, last_modified, entries):
+        """Store a feed's validators and entries, then enforce the size cap"""
+        record = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched': datetime.now().isoformat(),
+            'entries': entries
+        }
+        path = self._path(url)
+        with self._lock:
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f)
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def _evict(self):
+        """Delete least recently used feeds until the cache fits max_bytes"""
+        files = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+
+        for mtime, size, name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+                total -= size
+            except OSError:
+                pass
+
+
+# Page elements that never hold article text
+_BOILERPLATE_TAGS = ['script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form']
+
+
+def extract_article_text(page):
+    """Extract the readable paragraph text from an HTML page (bytes or str)"""
+    if isinstance(page, str):
+        page = page.encode('utf-8')
+    if not page.strip():
+        return ''
+    
+    lxml_html = _lxml_html()
+    if lxml_html is not None:
+        try:
+            doc = lxml_html.fromstring(page)
+        except Exception:
+            return ''
+        for element in doc.xpath('|'.join(f'//{tag}' for tag in _BOILERPLATE_TAGS)):
+            element.drop_tree()
+        paragraphs = doc.xpath('//article//p') or doc.xpath('//p')
+        texts = [p.text_content() for p in paragraphs] if paragraphs else [doc.text_content()]
+    else:
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(page, 'html.parser')
+        for element in soup(_BOILERPLATE_TAGS):
+            element.decompose()
+        paragraphs = (soup.find('article') or soup).find_all('p')
+        texts = [p.get_text(' ') for p in paragraphs] if paragraphs else [soup.get_text(' ')]
+    
+    return ' '.join(' '.join(text.split()) for text in texts if text)
+
+
+class ArticleTextFetcher:
+    """Download article pages and cache their extracted text by URL.
+
+    Pages are fetched on a bounded thread pool sharing one pooled session,
+    with a minimum gap between requests to the same host. Bodies are
+    streamed and cut off at max_bytes, and the extracted text is kept in
+    SQLite so each article is downloaded at most once.
+    """
+
+    def __init__(self, cache_path='article_text_cache.db', max_workers=8, per_host_interval=1.0,
+                 timeout=10, max_bytes=2 * 1024 * 1024, user_agent=None, metrics=None):
+        self.max_workers = max_workers
+        self.per_host_interval = per_host_interval
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.user_agent = user_agent
+        self.metrics = metrics or Metrics()
+        self._host_lock = threading.Lock()
+        self._host_next = {}
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS article_text (
+                url TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                fetched TEXT NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    def _wait_for_host(self, url):
+        """Sleep until this URL's host may be requested again"""
+        host = urlparse(url).netloc
+        with self._host_lock:
+            now = time.monotonic()
+            slot = max(now, self._host_next.get(host, 0.0))
+            self._host_next[host] = slot + self.per_host_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def _download(self, session, url):
+        """Stream one page (up to max_bytes) and extract its text"""
+        self._wait_for_host(url)
+        with self.metrics.timer('article_fetch'):
+            with session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type:
+                    return ''
+                chunks = []
+                size = 0
+                for chunk in response.iter_content(64 * 1024):
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= self.max_bytes:
+                        break
+        body = b''.join(chunks)[:self.max_bytes]
+        self.metrics.incr('article_bytes_fetched', len(body))
+        with self.metrics.timer('article_extract'):
+            return extract_article_text(body)
+
+    def fetch_many(self, urls):
+        """Return {url: text} for the URLs, downloading only uncached ones"""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        texts = {}
+        for i in range(0, len(urls), 500):
+            chunk = urls[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            texts.update(self.conn.execute(
+                f'SELECT url, text FROM article_text WHERE url IN ({placeholders})', chunk
+            ))
+        self.metrics.incr('article_cache_hits', len(texts))
+
+        missing = [url for url in urls if url not in texts]
+        if not missing:
+            return texts
+
+        session = _pooled_session(self.max_workers, self.user_agent)
+
+        downloaded = []
+        with session, ThreadPoolExecutor(max_workers=max(1, min(len(missing), self.max_workers))) as executor:
+            futures = {executor.submit(self._download, session, url): url for url in missing}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    texts[url] = future.result()
+                    downloaded.append((url, texts[url], datetime.now().isoformat()))
+                except Exception:
+                    # Not cached, so the page is retried on a later poll
+                    self.metrics.incr('article_fetch_errors')
+
+        self.conn.executemany('INSERT OR REPLACE INTO article_text (url, text, fetched) VALUES (?, ?, ?)',
+                              downloaded)
+        self.conn.commit()
+        return texts
+
+
+def _capitalize_token(token):
+    """token with its first letter upper-cased, if that survives lower-casing back"""
+    first = token[0].upper()
+    return first + token[1:] if len(first) == 1 and first.lower() == token[0] else token
+
+
+class ArticleStore:
+    """SQLite store of every feed entry already processed.
+
+    Entries are keyed by a hash of their URL and GUID, so incremental runs
+    only match entries they have not seen before, and keyword hits survive
+    restarts for the report and export stages. Hourly and daily rollups of
+    the hits are kept up to date as they are added, so dashboard windows
+    cover all stored history.
+
+    Every entry's matched tokens are also kept (compressed) together with an
+    inverted index of term -> articles, so new keywords and contacts can be
+    matched against history (see MediaStoryKeywordSearcher.query_history).
+    """
+
+    def __init__(self, db_path='media_articles.db'):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS articles (
+                article_key TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                url TEXT,
+                guid TEXT,
+                title TEXT,
+                published TEXT,
+                published_at TEXT,
+                summary TEXT,
+                keywords_found TEXT,
+                contacts_mentioned TEXT,
+                matched INTEGER NOT NULL,
+                first_seen TEXT NOT NULL
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_articles_matched ON articles (matched, published_at)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS terms (term_id INTEGER PRIMARY KEY, term TEXT NOT NULL UNIQUE)')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS postings (
+                term_id INTEGER NOT NULL,
+                article_id INTEGER NOT NULL,
+                PRIMARY KEY (term_id, article_id)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS article_tokens (article_id INTEGER PRIMARY KEY, tokens BLOB NOT NULL)')
+        self.conn.execute('CREATE TABLE IF NOT EXISTS store_meta (key TEXT PRIMARY KEY, value TEXT)')
+        # Entries held back after failed body fetches (see record_fetch_failures)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS fetch_failures (
+                article_key TEXT PRIMARY KEY,
+                attempts INTEGER NOT NULL
+            )
+        ''')
+        # Keyword hit counts per hourly and daily bucket of publish time (see rollup_window)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS rollups (
+                bucket_seconds INTEGER NOT NULL,
+                start INTEGER NOT NULL,
+                articles INTEGER NOT NULL,
+                keywords TEXT NOT NULL,
+                sources TEXT NOT NULL,
+                contacts TEXT NOT NULL,
+                PRIMARY KEY (bucket_seconds, start)
+            ) WITHOUT ROWID
+        ''')
+        self.conn.commit()
+        self._index_existing()
+        self._rollup_existing()
+
+    # Bucket sizes of the stored rollups (hourly and daily)
+    ROLLUP_SECONDS = (3600, 86400)
+
+    @staticmethod
+    def article_key(url, guid):
+        """Stable key for a feed entry"""
+        return hashlib.sha1(f"{url}\n{guid}".encode('utf-8')).hexdigest()
+
+    def seen_keys(self, keys):
+        """Return the subset of keys already in the store"""
+        keys = list(keys)
+        seen = set()
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f'SELECT article_key FROM articles WHERE article_key IN ({placeholders})', chunk
+            )
+            seen.update(row[0] for row in rows)
+        return seen
+
+    def fetch_failures(self, keys):
+        """article key -> failed body fetches so far, for keys not yet stored"""
+        keys = list(keys)
+        attempts = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            attempts.update(self.conn.execute(
+                f'SELECT article_key, attempts FROM fetch_failures WHERE article_key IN ({placeholders})', chunk
+            ))
+        return attempts
+
+    def record_fetch_failures(self, keys):
+        """Count one more failed body fetch for entries left out of the store to be retried"""
+        self.conn.executemany('''
+            INSERT INTO fetch_failures (article_key, attempts) VALUES (?, 1)
+            ON CONFLICT (article_key) DO UPDATE SET attempts = attempts + 1
+        ''', ((key,) for key in keys))
+        self.conn.commit()
+
+    def add(self, articles):
+        """Record processed entries (dicts with the articles table columns)
+        
+        An entry's 'tokens' (the token list it was matched on, including any
+        article body) and their 'capitalized' positions are indexed; without them
+        its title and summary are.
+        """
+        articles = list(articles)
+        now = datetime.now().isoformat()
+        keys = [a['article_key'] for a in articles]
+        seen = self.seen_keys(keys)
+        new_hits = {}
+        for a in articles:
+            if a['keywords_found'] and a['article_key'] not in seen:
+                new_hits.setdefault(a['article_key'], a)
+        self.conn.executemany('''
+            INSERT OR IGNORE INTO articles
+                (article_key, source, url, guid, title, published, published_at, summary,
+                 keywords_found, contacts_mentioned, matched, first_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [
+            (a['article_key'], a['source'], a['url'], a['guid'], a['title'], a['published'],
+             a['published_at'], a['summary'], json.dumps(a['keywords_found']),
+             json.dumps(a['contacts_mentioned']), int(bool(a['keywords_found'])), now)
+            for a in articles
+        ])
+        self.conn.executemany('DELETE FROM fetch_failures WHERE article_key = ?',
+                              ((a['article_key'],) for a in articles))
+
+        self._update_rollups(new_hits.values())
+
+        rowids = {}
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rowids.update(self.conn.execute(
+                f'SELECT article_key, rowid FROM articles WHERE article_key IN ({placeholders})', chunk
+            ))
+        self._index([
+            (rowids[a['article_key']], a['tokens'], a.get('capitalized', ())) if a.get('tokens') else
+            (rowids[a['article_key']], tokenize(f"{a['title'] or ''} {a['summary'] or ''}"),
+             capitalized_positions(a['title'], a['summary']))
+            for a in articles
+        ])
+        self.conn.commit()
+
+    def _term_ids(self, terms, create=False):
+        """term -> term_id for the given terms (adding unknown terms when create is set)"""
+        terms = list(terms)
+        if create:
+            self.conn.executemany('INSERT OR IGNORE INTO terms (term) VALUES (?)', ((term,) for term in terms))
+        ids = {}
+        for i in range(0, len(terms), 500):
+            chunk = terms[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            ids.update(self.conn.execute(f'SELECT term, term_id FROM terms WHERE term IN ({placeholders})', chunk))
+        return ids
+
+    def _index(self, docs):
+        """Store and index (article rowid, tokens, capitalized positions) triples;
+        already indexed articles are skipped. Capitalized tokens keep their
+        capital in the token blob."""
+        indexed = set()
+        for i in range(0, len(docs), 500):
+            chunk = [article_id for article_id, _, _ in docs[i:i + 500]]
+            placeholders = ','.join('?' * len(chunk))
+            indexed.update(row[0] for row in self.conn.execute(
+                f'SELECT article_id FROM article_tokens WHERE article_id IN ({placeholders})', chunk
+            ))
+        docs = [doc for doc in docs if doc[0] not in indexed]
+        term_ids = self._term_ids({token for _, tokens, _ in docs for token in tokens}, create=True)
+        self.conn.executemany('INSERT INTO article_tokens (article_id, tokens) VALUES (?, ?)', [
+            (article_id, zlib.compress(' '.join(
+                _capitalize_token(token) if i in capitalized else token for i, token in enumerate(tokens)
+            ).encode('utf-8'))) for article_id, tokens, capitalized in docs
+        ])
+        self.conn.executemany('INSERT OR IGNORE INTO postings (term_id, article_id) VALUES (?, ?)', [
+            (term_ids[token], article_id) for article_id, tokens, _ in docs for token in set(tokens)
+        ])
+
+    def _index_existing(self):
+        """Index articles stored before the token index existed (runs once per database)"""
+        if self.conn.execute("SELECT 1 FROM store_meta WHERE key = 'token_index'").fetchone():
+            return
+        last = 0
+        while True:
+            rows = self.conn.execute('''
+                SELECT rowid, title, summary FROM articles WHERE rowid > ? ORDER BY rowid LIMIT 500
+            ''', (last,)).fetchall()
+            if not rows:
+                break
+            self._index([(rowid, tokenize(f"{title or ''} {summary or ''}"), capitalized_positions(title, summary))
+                         for rowid, title, summary in rows])
+            last = rows[-1][0]
+        self.conn.execute("INSERT INTO store_meta (key, value) VALUES ('token_index', ?)",
+                          (datetime.now().isoformat(),))
+        self.conn.commit()
+
+    def _update_rollups(self, hits):
+        """Count newly stored keyword hits (dicts as for add) in the rollups;
+        undated hits are left out"""
+        dated = []
+        for hit in hits:
+            published_at = _stored_timestamp(hit['published_at'], hit['published'])
+            if published_at is not None:
+                dated.append((published_at, hit))
+        if not dated:
+            return
+        for seconds in self.ROLLUP_SECONDS:
+            rollup = TimeRollup(seconds)
+            rollup.buckets.update(self._rollup_buckets(
+                seconds, {rollup.bucket_start(published_at.timestamp()) for published_at, _ in dated}
+            ))
+            for published_at, hit in dated:
+                rollup.add(published_at, hit['source'], hit['keywords_found'], hit['contacts_mentioned'])
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO rollups (bucket_seconds, start, articles, keywords, sources, contacts)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', [
+                (seconds, start, bucket['articles'], json.dumps(bucket['keywords']),
+                 json.dumps(bucket['sources']), json.dumps(bucket['contacts']))
+                for start, bucket in rollup.buckets.items()
+            ])
+
+    @staticmethod
+    def _rollup_bucket(articles, keywords, sources, contacts):
+        """A rollups row as a TimeRollup bucket"""
+        return {'articles': articles, 'keywords': Counter(json.loads(keywords)),
+                'sources': Counter(json.loads(sources)), 'contacts': Counter(json.loads(contacts))}
+
+    def _rollup_buckets(self, bucket_seconds, starts):
+        """bucket start -> stored bucket, for the given starts"""
+        starts = list(starts)
+        buckets = {}
+        for i in range(0, len(starts), 500):
+            chunk = starts[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(f'''
+                SELECT start, articles, keywords, sources, contacts FROM rollups
+                WHERE bucket_seconds = ? AND start IN ({placeholders})
+            ''', [bucket_seconds] + chunk)
+            buckets.update((start, self._rollup_bucket(*counts)) for start, *counts in rows)
+        return buckets
+
+    def rollup_window(self, bucket_seconds, start, end):
+        """(bucket start, counts) for stored buckets starting in [bucket of start, end),
+        oldest first, as TimeRollup.window"""
+        first = int(start // bucket_seconds) * bucket_seconds
+        rows = self.conn.execute('''
+            SELECT start, articles, keywords, sources, contacts FROM rollups
+            WHERE bucket_seconds = ? AND start >= ? AND start < ? ORDER BY start
+        ''', (bucket_seconds, first, int(end)))
+        return [(start, self._rollup_bucket(*counts)) for start, *counts in rows]
+
+    def _rollup_existing(self):
+        """Roll up hits stored before the rollups existed (runs once per database)"""
+        if self.conn.execute("SELECT 1 FROM store_meta WHERE key = 'rollups'").fetchone():
+            return
+        last = 0
+        while True:
+            rows = self.conn.execute('''
+                SELECT rowid, source, published, published_at, keywords_found, contacts_mentioned
+                FROM articles WHERE matched = 1 AND rowid > ? ORDER BY rowid LIMIT 5000
+            ''', (last,)).fetchall()
+            if not rows:
+                break
+            self._update_rollups({'source': source, 'published': published, 'published_at': published_at,
+                                  'keywords_found': json.loads(keywords), 'contacts_mentioned': json.loads(contacts)}
+                                 for _, source, published, published_at, keywords, contacts in rows)
+            last = rows[-1][0]
+        self.conn.execute("INSERT INTO store_meta (key, value) VALUES ('rollups', ?)",
+                          (datetime.now().isoformat(),))
+        self.conn.commit()
+
+    def articles_containing(self, phrases):
+        """IDs of articles containing every token of at least one phrase (token tuples)"""
+        term_ids = self._term_ids({token for phrase in phrases for token in phrase})
+        found = set()
+        for phrase in phrases:
+            ids = [term_ids.get(token) for token in dict.fromkeys(phrase)]
+            if not ids or None in ids:
+                continue
+            query = ' INTERSECT '.join(['SELECT article_id FROM postings WHERE term_id = ?'] * len(ids))
+            found.update(row[0] for row in self.conn.execute(query, ids))
+        return found
+
+    def iter_indexed(self, article_ids, since=None):
+        """Yield (entry, tokens, capitalized positions) for the given article IDs in the
+        order they were first seen
+
+        since filters on publish date as in iter_matches.
+        """
+        article_ids = sorted(article_ids)
+        for i in range(0, len(article_ids), 500):
+            chunk = article_ids[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            query = f'''
+                SELECT a.source, a.title, a.url, a.published, a.published_at, a.summary, t.tokens
+                FROM articles a JOIN article_tokens t ON t.article_id = a.rowid
+                WHERE a.rowid IN ({placeholders})
+            '''
+            params = list(chunk)
+            if since is not None:
+                query += ' AND (a.published_at IS NULL OR a.published_at >= ?)'
+                params.append(since.isoformat())
+            query += ' ORDER BY a.rowid'
+            for source, title, url, published, published_at, summary, tokens in self.conn.execute(query, params):
+                entry = {'source': source, 'title': title, 'url': url, 'published': published, 'summary': summary,
+                         'published_at': _stored_timestamp(published_at, published)}
+                tokens = zlib.decompress(tokens).decode('utf-8').split()
+                capitalized = {i for i, token in enumerate(tokens) if token[0].isupper()}
+                yield entry, [token.lower() for token in tokens] if capitalized else tokens, capitalized
+
+    def iter_matches(self, since=None):
+        """Yield stored keyword hits in the order they were first seen.
+
+        Entries without a publish date are always included, as in
+        search_rss_feeds.
+        """
+        query = '''
+            SELECT source, title, url, published, published_at, summary, keywords_found, contacts_mentioned
+            FROM articles WHERE matched = 1
+        '''
+        params = ()
+        if since is not None:
+            query += ' AND (published_at IS NULL OR published_at >= ?)'
+            params = (since.isoformat(),)
+        query += ' ORDER BY rowid'
+
+        rows = self.conn.execute(query, params)
+        for source, title, url, published, published_at, summary, keywords, contacts in rows:
+            yield {
+                'source': source,
+                'title': title or 'No title',
+                'url': url,
+                'published': published,
+                'summary': summary[:200] + '...',
+                'keywords_found': json.loads(keywords),
+                'contacts_mentioned': json.loads(contacts),
+                'published_at': _stored_timestamp(published_at, published)
+            }
+
+    def close(self):
+        self.conn.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket: rate requests per second, bursts of up to capacity"""
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now (the balance may go negative) so waiting
+            # callers are served in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+def _search_entry(title, url, published, summary, source=''):
+    """A search API hit as a normalized feed entry (see _normalize_entry)"""
+    published_parsed = None
+    try:
+        parsed = datetime.fromisoformat(published.replace('Z', '+00:00')) if published else None
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc)
+        published_parsed = list(parsed.timetuple())
+    return {
+        'id': url,
+        'title': title or '',
+        'link': url or '',
+        'published': published or 'Unknown',
+        'published_parsed': published_parsed,
+        'summary': summary or '',
+        'source': source or ''
+    }
+
+
+class SearchProvider(ABC):
+    """Base class for news search APIs used by WebSearchBackend.
+
+    Subclasses set the provider limits below and implement search(), which
+    returns one page of normalized entries (see _search_entry) for a query.
+    """
+
+    name = 'provider'
+    max_query_length = 500    # Longest query string the API accepts
+    requests_per_second = 1.0
+    burst = 1
+
+    def build_query(self, keywords):
+        """One query matching any of the keywords ("a b" OR c)"""
+        return ' OR '.join(f'"{keyword}"' if len(tokenize(keyword)) > 1 else keyword for keyword in keywords)
+
+    @abstractmethod
+    def search(self, query, since, until, page=1):
+        """Return (entries, total results reported by the API or None) for one page of a query"""
+
+
+class NewsAPIProvider(SearchProvider):
+    """NewsAPI.org /v2/everything (api_key defaults to $NEWSAPI_KEY)"""
+
+    name = 'newsapi'
+    max_query_length = 500
+    requests_per_second = 1.0
+    burst = 5
+    endpoint = 'https://newsapi.org/v2/everything'
+
+    def __init__(self, api_key=None, page_size=100, language='en', timeout=15, user_agent=None):
+        self.api_key = api_key or os.environ.get('NEWSAPI_KEY')
+        if not self.api_key:
+            raise ValueError("NewsAPI needs an API key (api_key or $NEWSAPI_KEY)")
+        self.page_size = page_size
+        self.language = language
+        self.timeout = timeout
+        self.session = _pooled_session(4, user_agent)
+
+    def search(self, query, since, until, page=1):
+        response = self.session.get(self.endpoint, timeout=self.timeout, params={
+            'q': query,
+            'from': since.isoformat(timespec='seconds'),
+            'to': until.isoformat(timespec='seconds'),
+            'language': self.language,
+            'sortBy': 'publishedAt',
+            'pageSize': self.page_size,
+            'page': page
+        }, headers={'X-Api-Key': self.api_key})
+        response.raise_for_status()
+        data = response.json()
+        return [
+            _search_entry(article.get('title'), article.get('url'), article.get('publishedAt'),
+                          article.get('description'), (article.get('source') or {}).get('name'))
+            for article in data.get('articles', [])
+        ], data.get('totalResults')
+
+
+class StubSearchProvider(SearchProvider):
+    """Offline provider answering queries from a fixed list of entries.
+
+    Matches OR-queries with the same tokenizer as the feed search and keeps
+    every query it was asked in self.queries, for tests and benchmarks.
+    """
+
+    name = 'stub'
+
+    def __init__(self, entries=(), max_query_length=500, requests_per_second=50.0, burst=10, page_size=100):
+        self.entries = list(entries)
+        self.page_size = page_size
+        self.max_query_length = max_query_length
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.queries = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_jsonl(cls, path, **options):
+        """Stub over a JSONL file of {title, url, published, summary, source} records"""
+        entries = []
+        with _open_archive(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    entries.append(_search_entry(record.get('title'), record.get('url') or record.get('link'),
+                                                 record.get('published'), record.get('summary'),
+                                                 record.get('source')))
+        return cls(entries, **options)
+
+    def search(self, query, since, until, page=1):
+        with self._lock:
+            self.queries.append(query)
+        matcher = PhraseMatcher()
+        for phrase in query.split(' OR '):
+            matcher.add(phrase.strip('"'), True)
+        hits = []
+        for entry in self.entries:
+            published = entry['published_parsed']
+            if published and not (since <= datetime(*published[:6], tzinfo=timezone.utc) <= until):
+                continue
+            if matcher.find(tokenize(f"{entry['title']} {entry['summary']}")):
+                hits.append(dict(entry))
+        return hits[(page - 1) * self.page_size:page * self.page_size], len(hits)
+
+
+SEARCH_PROVIDERS = {'newsapi': NewsAPIProvider, 'stub': StubSearchProvider}
+
+
+def pack_queries(keywords, provider):
+    """Group keywords into as few OR-queries as the provider's length limit allows"""
+    queries = []
+    batch = []
+    for keyword in keywords:
+        if batch and len(provider.build_query(batch + [keyword])) > provider.max_query_length:
+            queries.append(provider.build_query(batch))
+            batch = []
+        batch.append(keyword)
+    if batch:
+        queries.append(provider.build_query(batch))
+    return queries
+
+
+class WebSearchBackend:
+    """Runs packed keyword queries against a SearchProvider.
+
+    Queries run on a thread pool behind the provider's token bucket, each
+    reading up to max_pages result pages; queries with more results than
+    that are counted in the web_search_truncated metric. Responses are
+    cached in SQLite by provider, query, page budget and (hour-aligned)
+    time window for cache_ttl seconds, so repeated runs in the same window
+    cost no API quota.
+    """
+
+    def __init__(self, provider, cache_path='search_cache.db', max_workers=4, cache_ttl=3600, metrics=None,
+                 max_pages=3):
+        self.provider = provider
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self.cache_ttl = cache_ttl
+        self.metrics = metrics or Metrics()
+        self.bucket = TokenBucket(provider.requests_per_second, provider.burst)
+        self.conn = sqlite3.connect(cache_path)
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS search_cache (
+                cache_key TEXT PRIMARY KEY,
+                entries TEXT NOT NULL,
+                fetched REAL NOT NULL
+            )
+        ''')
+        self.conn.commit()
+
+    def _cache_key(self, query, since, until):
+        return hashlib.sha1(json.dumps(
+            [self.provider.name, query, self.max_pages, since.isoformat(), until.isoformat()]
+        ).encode('utf-8')).hexdigest()
+
+    def _query(self, query, since, until):
+        """Read up to max_pages pages of one query, each once the rate limiter allows it"""
+        provider = self.provider.name
+        entries = []
+        total = None
+        for page in range(1, self.max_pages + 1):
+            self.bucket.acquire()
+            try:
+                with self.metrics.timer('web_search_query', provider=provider):
+                    page_entries, total = self.provider.search(query, since, until, page)
+            except Exception:
+                if page == 1:
+                    raise
+                # APIs may cap how deep results can be paged; keep what was read
+                self.metrics.incr('web_search_page_errors', provider=provider)
+                break
+            entries.extend(page_entries)
+            if not page_entries or total is None or len(entries) >= total:
+                break
+        if total is not None and total > len(entries):
+            self.metrics.incr('web_search_truncated', provider=provider)
+            self.metrics.incr('web_search_results_missed', total - len(entries), provider=provider)
+            print(f"⚠️  {provider} returned {len(entries)} of {total} results for ({query[:60]}...); "
+                  f"raise max_pages or narrow the window")
+        return entries
+
+    def search(self, keywords, days_back=7):
+        """Return {query: entries} for the keywords, in query order"""
+        until = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+        since = until - timedelta(days=days_back, hours=1)
+        queries = pack_queries(keywords, self.provider)
+        keys = {query: self._cache_key(query, since, until) for query in queries}
+
+        results = {}
+        fresh_after = time.time() - self.cache_ttl
+        for query, cache_key in keys.items():
+            row = self.conn.execute('SELECT entries, fetched FROM search_cache WHERE cache_key = ?',
+                                    (cache_key,)).fetchone()
+            if row and row[1] >= fresh_after:
+                results[query] = json.loads(row[0])
+        self.metrics.incr('web_search_cache_hits', len(results), provider=self.provider.name)
+
+        missing = [query for query in queries if query not in results]
+        fetched = []
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(missing), self.max_workers))) as executor:
+                futures = {executor.submit(self._query, query, since, until): query for query in missing}
+                for future in as_completed(futures):
+                    query = futures[future]
+                    try:
+                        results[query] = future.result()
+                        fetched.append((keys[query], json.dumps(results[query]), time.time()))
+                    except Exception as e:
+                        self.metrics.incr('web_search_errors', provider=self.provider.name)
+                        print(f"❌ Web search query failed ({query[:60]}...): {str(e)}")
+        self.conn.executemany('INSERT OR REPLACE INTO search_cache (cache_key, entries, fetched) VALUES (?, ?, ?)',
+                              fetched)
+        self.conn.commit()
+        self.metrics.incr('web_search_queries', len(fetched), provider=self.provider.name)
+        return {query: results[query] for query in queries if query in results}
+
+
+# Archive formats accepted by MediaStoryKeywordSearcher.backfill_archives
+ARCHIVE_SUFFIXES = ('.xml', '.rss', '.atom', '.jsonl', '.jsonl.gz', '.warc', '.warc.gz')
+
+
+def iter_archive_files(paths):
+    """Expand files and directories into a sorted list of archive files"""
+    if isinstance(paths, str):
+        paths = [paths]
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in names
+                             if name.lower().endswith(ARCHIVE_SUFFIXES))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+def _open_archive(path):
+    """Open an archive file for binary reading, transparently gunzipping"""
+    return gzip.open(path, 'rb') if path.endswith('.gz') else open(path, 'rb')
+
+
+def _host_sources(media_sources):
+    """Map hostnames in the media source URLs to source names"""
+    hosts = {}
+    for name, info in media_sources.items():
+        for key in ('rss', 'search_url'):
+            host = urlparse(info.get(key, '')).netloc.lower()
+            if host:
+                hosts.setdefault(host[4:] if host.startswith('www.') else host, name)
+    return hosts
+
+
+def _source_for_url(url, host_sources, default):
+    """Name of the media source whose domain hosts url (or default)"""
+    parts = urlparse(url).netloc.lower().split('.')
+    for i in range(len(parts) - 1):
+        source = host_sources.get('.'.join(parts[i:]))
+        if source:
+            return source
+    return default
+
+
+def _iter_warc_records(f):
+    """Yield (headers, payload) for each record of a WARC file"""
+    while True:
+        line = f.readline()
+        if not line:
+            return
+        if not line.strip():
+            continue
+        headers = {}
+        for line in iter(f.readline, b''):
+            if not line.strip():
+                break
+            name, _, value = line.decode('utf-8', 'replace').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        yield headers, f.read(int(headers.get('content-length', 0)))
+
+
+def _warc_entries(payload, headers):
+    """Entries from one WARC response record (a feed or an article page)"""
+    _, _, body = payload.partition(b'\r\n\r\n')
+    head = body[:512].lstrip().lower()
+    if head.startswith(b'<?xml') or b'<rss' in head or b'<feed' in head:
+        import feedparser
+        return [_normalize_entry(entry) for entry in feedparser.parse(body).entries]
+
+    url = headers.get('warc-target-uri', '')
+    match = re.search(rb'<title[^>]*>(.*?)</title>', body[:65536], re.IGNORECASE | re.DOTALL)
+    title = html.unescape(match.group(1).decode('utf-8', 'replace').strip()) if match else ''
+    published = headers.get('warc-date', '')
+    try:
+        published_parsed = list(datetime.strptime(published[:19], '%Y-%m-%dT%H:%M:%S').timetuple())
+    except ValueError:
+        published_parsed = None
+    return [{
+        'id': headers.get('warc-record-id', url),
+        'title': title,
+        'link': url,
+        'published': published or 'Unknown',
+        'published_parsed': published_parsed,
+        'summary': '',
+        'text': extract_article_text(body)
+    }]
+
+
+def _archive_shards(files, shard_bytes):
+    """Split archive files into (path, byte range) shards for the process pool.
+
+    Uncompressed JSONL dumps are split into byte ranges of about shard_bytes
+    (see _iter_lines) so one large dump still spreads across workers without
+    a counting pass; gzipped dumps and other formats are one shard per file.
+    """
+    shards = []
+    for path in files:
+        if path.lower().endswith('.jsonl'):
+            size = os.path.getsize(path)
+            for start in range(0, max(size, 1), shard_bytes):
+                shards.append((path, (start, start + shard_bytes)))
+        else:
+            shards.append((path, None))
+    return shards
+
+
+def _iter_lines(f, byte_range=None):
+    """Lines of a binary file, or only those starting within byte_range=(start, stop)"""
+    if byte_range is None:
+        yield from f
+        return
+    start, stop = byte_range
+    if start:
+        # Skip the rest of the line running into the range; it belongs to the previous shard
+        f.seek(start - 1)
+        f.readline()
+    position = f.tell()
+    while position < stop:
+        line = f.readline()
+        if not line:
+            break
+        position += len(line)
+        yield line
+
+
+def read_archive(path, host_sources, byte_range=None, batch_size=1000):
+    """Stream (source name, entries) batches from one archive file.
+
+    .xml/.rss/.atom files are parsed as feeds, .jsonl(.gz) files hold one
+    entry object per line (title, summary, link, id, published, optional
+    source and text), and .warc(.gz) bundles may hold feed documents or
+    article pages. Sources come from the entry, the feed's link, or the
+    file name. byte_range=(start, stop) reads only the lines starting in
+    that part of an uncompressed JSONL file.
+    """
+    name = os.path.basename(path)
+    default_source = name.split('.')[0]
+    lower = name.lower()
+
+    if lower.endswith(('.jsonl', '.jsonl.gz')):
+        batches = defaultdict(list)
+        with _open_archive(path) as f:
+            for line in _iter_lines(f, byte_range):
+                if not line.strip():
+                    continue
+                raw = json.loads(line)
+                entry = _normalize_entry(raw)
+                if not entry['published_parsed']:
+                    # Dumps usually carry only the date string; parse it so
+                    # the since/until and window filters apply
+                    published_at = _parse_timestamp(raw.get('published'))
+                    if published_at is not None:
+                        entry['published_parsed'] = list(published_at.timetuple())
+                if raw.get('text'):
+                    entry['text'] = raw['text']
+                source = raw.get('source') or _source_for_url(entry['link'], host_sources, default_source)
+                batches[source].append(entry)
+                if len(batches[source]) >= batch_size:
+                    yield source, batches.pop(source)
+        for source, entries in batches.items():
+            yield source, entries
+
+    elif lower.endswith(('.warc', '.warc.gz')):
+        with _open_archive(path) as f:
+            for headers, payload in _iter_warc_records(f):
+                if headers.get('warc-type') != 'response':
+                    continue
+                url = headers.get('warc-target-uri', '')
+                entries = _warc_entries(payload, headers)
+                if entries:
+                    yield _source_for_url(url, host_sources, default_source), entries
+
+    else:
+        import feedparser
+        with _open_archive(path) as f:
+            feed = feedparser.parse(f.read())
+        source = _source_for_url(feed.feed.get('link', ''), host_sources, default_source)
+        yield source, [_normalize_entry(entry) for entry in feed.entries]
+
+
+# Per-process state for backfill workers, set once by _init_backfill_worker
+_backfill_searcher = None
+
+
+class _EntryCollector:
+    """Stands in for the ArticleStore in backfill workers: keeps the processed
+    entries (with their tokens) for the parent process to store"""
+
+    def __init__(self):
+        self.entries = []
+
+    def seen_keys(self, keys):
+        return set()
+
+    def add(self, articles):
+        self.entries.extend(articles)
+
+
+def _init_backfill_worker(state):
+    """Install the parent's compiled matchers in a backfill worker process"""
+    global _backfill_searcher
+    # Bypass __init__ so the matchers shipped from the parent are used as-is
+    # instead of being rebuilt in every worker
+    searcher = MediaStoryKeywordSearcher.__new__(MediaStoryKeywordSearcher)
+    searcher.__dict__.update(state)
+    searcher.article_store = None
+    searcher.article_fetcher = None
+    searcher.result_stream = None
+    searcher.metrics = Metrics()
+    searcher._reset_results()
+    _backfill_searcher = searcher
+
+
+def _backfill_file(args):
+    """Match every entry in one archive file; returns (path, entries read, hits,
+    processed entries for the article store, or None when not storing)"""
+    path, byte_range, since, until, store_entries = args
+    searcher = _backfill_searcher
+    searcher.article_store = _EntryCollector() if store_entries else None
+    hits = []
+    total = 0
+    for source, entries in read_archive(path, searcher._host_sources, byte_range):
+        total += len(entries)
+        if until is not None:
+            entries = [e for e in entries
+                       if not e.get('published_parsed') or datetime(*e['published_parsed'][:6]) < until]
+        results, _ = searcher._process_entries(source, entries, since or datetime.min)
+        hits.extend(result.to_dict() for result in results)
+    searcher._reset_results()
+    return path, total, hits, searcher.article_store and searcher.article_store.entries
+
+
+class ArticleRecord:
+    """One search hit, stored compactly.
+
+    Keywords and contacts are kept as tuples of small integer IDs into the
+    owning ResultTable, and the source name is interned, so a hit costs a
+    few slots instead of a dict holding copied lists. Records still support
+    the dict-style access the writers use (record['keywords_found'], ...).
+    """
+
+    __slots__ = ('article_id', 'source', 'title', 'url', 'published', 'published_at', 'summary',
+                 'keyword_ids', 'contact_ids', '_table')
+
+    FIELDS = ('source', 'title', 'url', 'published', 'summary', 'keywords_found', 'contacts_mentioned',
+              'published_at')
+
+    def __init__(self, table, article_id, source, title, url, published, summary, keyword_ids, contact_ids,
+                 published_at=None):
+        self._table = table
+        self.article_id = article_id
+        self.source = source
+        self.title = title
+        self.url = url
+        self.published = published
+        self.published_at = published_at  # Parsed UTC datetime, None if unknown
+        self.summary = summary
+        self.keyword_ids = keyword_ids
+        self.contact_ids = contact_ids
+
+    @property
+    def keywords_found(self):
+        keywords = self._table.keywords
+        return [keywords[i] for i in self.keyword_ids]
+
+    @property
+    def contacts_mentioned(self):
+        contacts = self._table.contacts
+        return [contacts[i] for i in self.contact_ids]
+
+    def __getitem__(self, field):
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field) if field in self.FIELDS else default
+
+    def to_dict(self):
+        """The hit as a plain result dict"""
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def __repr__(self):
+        return f"ArticleRecord({self.to_dict()!r})"
+
+
+class ResultTable:
+    """Append-only table of ArticleRecords with interned keyword and contact names"""
+
+    def __init__(self):
+        self.records = []
+        self.keywords = []
+        self.contacts = []
+        self._keyword_ids = {}
+        self._contact_ids = {}
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __getitem__(self, article_id):
+        return self.records[article_id]
+
+    @staticmethod
+    def _intern(name, names, ids):
+        name_id = ids.get(name)
+        if name_id is None:
+            name_id = ids[name] = len(names)
+            names.append(name)
+        return name_id
+
+    def add(self, source, title, url, published, summary, keywords, contacts, published_at=None):
+        """Append a hit and return its record"""
+        keyword_ids = tuple(self._intern(k, self.keywords, self._keyword_ids) for k in keywords)
+        contact_ids = tuple(self._intern(c, self.contacts, self._contact_ids) for c in contacts)
+        record = ArticleRecord(self, len(self.records), sys.intern(source), title, url, published,
+                               summary, keyword_ids, contact_ids, published_at)
+        self.records.append(record)
+        return record
+
+
+# Dashboard windows (name -> seconds) served from the time rollups
+DASHBOARD_WINDOWS = {'24h': 24 * 3600, '7d': 7 * 86400, '90d': 90 * 86400}
+
+
+def _window_seconds(spec):
+    """Length of a window spec such as '24h', '7d' or '2w', in seconds"""
+    match = re.fullmatch(r'(\d+)([hdw])', spec.strip().lower())
+    if not match:
+        raise ValueError(f"invalid window {spec!r} (expected e.g. 24h, 7d or 2w)")
+    return int(match.group(1)) * {'h': 3600, 'd': 86400, 'w': 7 * 86400}[match.group(2)]
+
+
+class TimeRollup:
+    """Article, keyword, source and contact counts per fixed-size UTC time bucket.
+
+    Buckets are keyed by their start (epoch seconds) and updated as results
+    arrive, so summarizing a window only touches that window's buckets
+    however much history has been added.
+    """
+
+    def __init__(self, bucket_seconds):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = {}
+
+    def bucket_start(self, timestamp):
+        """Start of the bucket holding an epoch timestamp"""
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+
+    def add(self, published_at, source, keywords, contacts):
+        """Count one result published at published_at (an aware datetime)"""
+        start = self.bucket_start(published_at.timestamp())
+        bucket = self.buckets.get(start)
+        if bucket is None:
+            bucket = self.buckets[start] = {'articles': 0, 'keywords': Counter(), 'sources': Counter(),
+                                            'contacts': Counter()}
+        bucket['articles'] += 1
+        bucket['keywords'].update(keywords)
+        bucket['sources'][source] += 1
+        bucket['contacts'].update(contacts)
+
+    def window(self, start, end):
+        """(bucket start, counts) for buckets starting in [bucket of start, end), oldest first"""
+        buckets = self.buckets
+        return [(t, buckets[t]) for t in range(self.bucket_start(start), int(end), self.bucket_seconds)
+                if t in buckets]
+
+
+class ResultAggregator:
+    """Counters over search results, updated as each result arrives.
+
+    The report, export and dashboard writers all read from one aggregator
+    instead of each re-walking every article. Only a few sample articles are
+    kept per source and per contact, so memory stays bounded however many
+    results are added. Hourly and daily rollups by publish time (UTC) let
+    the dashboard summarize any recent window without rescanning results.
+    """
+
+    def __init__(self, source_samples=5, contact_samples=3):
+        self.source_sample_size = source_samples
+        self.contact_sample_size = contact_samples
+        self.total_articles = 0
+        self.total_contact_mentions = 0
+        self.keyword_counts = Counter()
+        self.keyword_sources = defaultdict(set)
+        self.source_counts = Counter()
+        self.source_keywords = defaultdict(set)
+        self.source_samples = defaultdict(list)
+        self.contact_counts = Counter()
+        self.contact_sources = defaultdict(set)
+        self.contact_samples = defaultdict(list)
+        self.undated_articles = 0
+        self.hourly = TimeRollup(3600)
+        self.daily = TimeRollup(86400)
+
+    def add(self, result):
+        """Fold one search result into every counter"""
+        source = result['source']
+        keywords = result['keywords_found']
+        self.total_articles += 1
+
+        for keyword in keywords:
+            self.keyword_counts[keyword] += 1
+            self.keyword_sources[keyword].add(source)
+
+        self.source_counts[source] += 1
+        self.source_keywords[source].update(keywords)
+        if len(self.source_samples[source]) < self.source_sample_size:
+            self.source_samples[source].append(result)
+
+        contacts = result['contacts_mentioned']
+        for contact in contacts:
+            self.total_contact_mentions += 1
+            self.contact_counts[contact] += 1
+            self.contact_sources[contact].add(source)
+            if len(self.contact_samples[contact]) < self.contact_sample_size:
+                self.contact_samples[contact].append(result)
+
+        published_at = result.get('published_at')
+        if published_at is None:
+            self.undated_articles += 1
+            return
+        self.hourly.add(published_at, source, keywords, contacts)
+        self.daily.add(published_at, source, keywords, contacts)
+
+    def timeline(self):
+        """Keyword counts per UTC day, oldest first"""
+        return {
+            datetime.fromtimestamp(start, timezone.utc).strftime('%Y-%m-%d'): dict(bucket['keywords'])
+            for start, bucket in sorted(self.daily.buckets.items())
+        }
+
+    def window_summary(self, seconds, now=None, store=None):
+        """Counts for results published in the last `seconds`, from the rollups
+        
+        Windows of up to two days use hourly buckets, longer ones daily
+        buckets; the window starts at the boundary of the bucket holding
+        now - seconds. Undated results are not included. With an
+        ArticleStore the buckets are read from its rollups, which cover all
+        stored hits, instead of the results added here.
+        """
+        now = time.time() if now is None else now
+        hourly = seconds <= 2 * 86400
+        rollup = self.hourly if hourly else self.daily
+        if store is None:
+            buckets = rollup.window(now - seconds, now + 1)
+        else:
+            buckets = store.rollup_window(rollup.bucket_seconds, now - seconds, now + 1)
+
+        articles = 0
+        keywords, sources, contacts = Counter(), Counter(), Counter()
+        timeline = []
+        for start, bucket in buckets:
+            articles += bucket['articles']
+            keywords.update(bucket['keywords'])
+            sources.update(bucket['sources'])
+            contacts.update(bucket['contacts'])
+            timeline.append({
+                'start': datetime.fromtimestamp(start, timezone.utc).isoformat(),
+                'articles': bucket['articles'],
+                'keywords': dict(bucket['keywords'])
+            })
+        return {
+            'start': datetime.fromtimestamp(rollup.bucket_start(now - seconds), timezone.utc).isoformat(),
+            'end': datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            'bucket': 'hour' if hourly else 'day',
+            'articles': articles,
+            'keywords': dict(keywords.most_common()),
+            'sources': dict(sources.most_common()),
+            'contacts': dict(contacts.most_common()),
+            'timeline': timeline
+        }
+
+
+class ResultStream:
+    """Append-only export of search hits, written as they are produced.
+
+    Hits are partitioned by UTC publish date and source under root_dir
+    (root_dir/2024-10-01/CNN/...), and every row still carries its own
+    source and publish date. A JSONL partition is one file that each run
+    appends to; Parquet cannot be appended, so every flush adds a new part
+    file. At most batch_size hits are buffered, so memory stays flat and a
+    run only pays for the hits it found.
+    """
+
+    FORMATS = ('jsonl', 'parquet')
+
+    def __init__(self, root_dir='media_search_results', format='jsonl', batch_size=1000):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown stream format {format!r} (expected one of {', '.join(self.FORMATS)})")
+        if format == 'parquet':
+            import pyarrow  # noqa: F401  (fail now rather than at the first flush)
+        self.root_dir = root_dir
+        self.format = format
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._pending = defaultdict(list)
+        self._pending_count = 0
+        self._run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self._part = 0
+
+    def partition_dir(self, day, source):
+        """Directory holding one date/source partition"""
+        return os.path.join(self.root_dir, day, re.sub(r'[^\w.-]+', '_', source))
+
+    def write(self, record):
+        """Queue one hit (an ArticleRecord or result dict) for the export"""
+        row = {field: record[field] for field in ArticleRecord.FIELDS}
+        published_at = row['published_at']
+        row['published_at'] = published_at.isoformat() if published_at else None
+        row['exported_at'] = datetime.now().isoformat(timespec='seconds')
+        day = published_at.strftime('%Y-%m-%d') if published_at else 'unknown'
+        self._pending[(day, row['source'])].append(row)
+        self._pending_count += 1
+        if self._pending_count >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write every buffered hit to its partition"""
+        if not self._pending_count:
+            return 0
+        self._part += 1
+        for (day, source), rows in self._pending.items():
+            directory = self.partition_dir(day, source)
+            os.makedirs(directory, exist_ok=True)
+            if self.format == 'jsonl':
+                with open(os.path.join(directory, 'results.jsonl'), 'a', encoding='utf-8') as f:
+                    f.writelines(json.dumps(row, ensure_ascii=False) + '\n' for row in rows)
+            else:
+                import pandas as pd
+                pd.DataFrame(rows).to_parquet(
+                    os.path.join(directory, f'part-{self._run_id}-{self._part:05d}.parquet'), index=False
+                )
+        written = self._pending_count
+        self.records_written += written
+        self._pending = defaultdict(list)
+        self._pending_count = 0
+        return written
+
+
+class _Candidate:
+    """An in-window feed entry between keyword matching and recording"""
+
+    __slots__ = ('key', 'entry', 'pub_date', 'tokens', 'keywords', 'texts', 'deferred')
+
+    def __init__(self, key, entry, pub_date, tokens, keywords, texts):
+        self.key = key              # ArticleStore key (None without a store)
+        self.entry = entry
+        self.pub_date = pub_date    # Naive UTC publish time, None if unknown
+        self.tokens = tokens
+        self.keywords = keywords
+        self.texts = texts          # Original-case texts behind the tokens
+        self.deferred = False       # Held back for a later poll after a failed body fetch
+
+
+# Version of the normalized contacts table saved in snapshots; bump it when
+# load_contacts changes its columns or normalization (e.g. name_key tokens)
+# so snapshots written by older code are rebuilt from the workbook
+CONTACTS_SNAPSHOT_VERSION = 1
+
 
 class MediaStoryKeywordSearcher:
     def __init__(self):
         self.media_sources = self._initialize_media_sources()
         self.contacts_df = None  # Changed from experts_df to contacts_df
-        self.search_results = defaultdict(list)
-        self.contact_mentions = defaultdict(list)  # Changed from expert_mentions
+        self._reset_results()
+        self.contact_names = []
+        self.contact_matcher = None
+        self.match_name_variants = True  # Initials, nicknames, middle names, typos
+        # Feed fetching settings (sources may override timeout/retries)
+        self.fetch_workers = 64
+        self.fetch_timeout = 15
+        self.fetch_retries = 2
+        self.fetch_backoff = 1.0
+        self.user_agent = 'Mozilla/5.0 (compatible; MediaStoryKeywordSearcher/1.0)'
+        self.feed_cache = None
+        self.article_store = None
+        self.article_fetcher = None
+        self.full_text_filter = 'keywords'
+        self.max_fetch_attempts = 3
+        self.result_stream = None
+        self.web_search = None
+        self.source_status = {}
+        self.metrics = Metrics()
         # Hardcoded keywords list
         self.keywords = [
             "Sexual harassment", "Sexual Assault", "Rape", "Raping", "Grope", "Groping", 
@@ -31,7 +1892,7 @@ class MediaStoryKeywordSearcher:
             "Sexism", "Sexual", "Racist", "Racism", "Racial", "Incest", "Incestuous", 
             "Sex trafficking", "Sex trafficker", "Misconduct", "League of the South", "KKK", 
             "Klu Klux Klan", "Disbarred", "Guilty", "Domestic violence", "Domestic abuse", 
-            "Allegation", "Allegations", "Alleged", "Theft", "Fugitive", "Felony", "Embezzle", 
+            "Theft", "Fugitive", "Felony", "Embezzle", 
             "Embezzlement", "Embezzling", "Pedophile", "Pedophilia", "Offensive", "Inappropriate", 
             "Inappropriately", "Hate", "Hatred", "Richard Spencer", "Child Abuse", 
             "Council of Conservative Citizens", "Institute of Historical Review", 
@@ -43,7 +1904,29 @@ class MediaStoryKeywordSearcher:
             "Date-Rape", "Rohypnol", "Flunitrazepam", "Ketamine", "Meth", "Methamphetamine", 
             "Cocaine", "Heroin", "Oxycodone", "Oxy", "LSD", "Holocaust Denial", "Holocaust Denier"
         ]
+        self._compile_keyword_matcher()
         
+    def _compile_keyword_matcher(self):
+        """Dedupe self.keywords and build the single-pass keyword matcher.
+
+        Call again after editing self.keywords.
+        """
+        unique_keywords = []
+        seen = set()
+        for keyword in self.keywords:
+            if keyword.lower() not in seen:
+                seen.add(keyword.lower())
+                unique_keywords.append(keyword)
+        self.keywords = unique_keywords
+
+        self.keyword_matcher = PhraseMatcher()
+        for idx, keyword in enumerate(self.keywords):
+            self.keyword_matcher.add(keyword, idx)
+
+    def match_keywords(self, tokens):
+        """Return the keywords found in a token list, in self.keywords order"""
+        return [self.keywords[idx] for idx in sorted(self.keyword_matcher.find(tokens))]
+
     def _initialize_media_sources(self):
         """Initialize media sources with their search endpoints"""
         return {
@@ -99,53 +1982,38 @@ class MediaStoryKeywordSearcher:
             }
         }
     
-    def load_contacts(self, contacts_path):
-        """Load contacts from Salesforce Excel file"""
+    def load_contacts(self, contacts_path, snapshot_dir='contacts_snapshot'):
+        """Load contacts from Salesforce Excel file
+        
+        The normalized contacts table, including the name matching keys, is
+        cached as a columnar snapshot in snapshot_dir and reused for as long
+        as the workbook's content hash and CONTACTS_SNAPSHOT_VERSION are
+        unchanged. Pass snapshot_dir=None to always parse the workbook.
+        """
+        start = time.perf_counter()
         try:
-            # Read the Excel file - the data starts at row 11 (0-indexed)
-            self.contacts_df = pd.read_excel(contacts_path, skiprows=10)
-            
-            # The first row contains empty cells and actual headers mixed
-            # We need to clean up the column names
-            # Based on the file structure, the actual columns are:
-            col_mapping = {
-                self.contacts_df.columns[1]: 'salutation',
-                self.contacts_df.columns[3]: 'firstname',
-                self.contacts_df.columns[4]: 'lastname',
-                self.contacts_df.columns[5]: 'title',
-                self.contacts_df.columns[6]: 'account_name',
-                self.contacts_df.columns[7]: 'mailing_street',
-                self.contacts_df.columns[8]: 'mailing_city',
-                self.contacts_df.columns[9]: 'mailing_state',
-                self.contacts_df.columns[10]: 'mailing_zip',
-                self.contacts_df.columns[11]: 'mailing_country',
-                self.contacts_df.columns[12]: 'phone',
-                self.contacts_df.columns[13]: 'fax',
-                self.contacts_df.columns[14]: 'mobile',
-                self.contacts_df.columns[15]: 'email',
-                self.contacts_df.columns[16]: 'account_owner'
-            }
-            
-            # Rename columns
-            self.contacts_df.rename(columns=col_mapping, inplace=True)
-            
-            # Drop rows where the first column contains header info
-            self.contacts_df = self.contacts_df[self.contacts_df['firstname'] != 'First Name'].copy()
-            
-            # Reset index
-            self.contacts_df.reset_index(drop=True, inplace=True)
+            self.contacts_df = None
+            if snapshot_dir:
+                source_hash = self._file_hash(contacts_path)
+                self.contacts_df = self._read_contacts_snapshot(contacts_path, snapshot_dir, source_hash)
             
-            print(f"\n✓ Loaded Salesforce contacts data: {len(self.contacts_df)} contacts")
+            if self.contacts_df is not None:
+                source = 'snapshot'
+                print(f"\n✓ Loaded Salesforce contacts data: {len(self.contacts_df)} contacts (cached snapshot)")
+            else:
+                source = 'excel'
+                with self.metrics.timer('contacts_parse'):
+                    self.contacts_df = self._parse_contacts_workbook(contacts_path)
+                print(f"\n✓ Loaded Salesforce contacts data: {len(self.contacts_df)} contacts")
+                if snapshot_dir:
+                    self._write_contacts_snapshot(contacts_path, snapshot_dir, source_hash)
             
-            # Create full name column
-            self.contacts_df['full_name'] = (
-                self.contacts_df['firstname'].astype(str).str.strip() + ' ' + 
-                self.contacts_df['lastname'].astype(str).str.strip()
-            )
-            self.contacts_df['full_name_lower'] = self.contacts_df['full_name'].str.lower()
-            
-            # Clean up NaN values
-            self.contacts_df['full_name'] = self.contacts_df['full_name'].str.replace('nan', '').str.strip()
+            # Index every contact name for single-pass matching
+            with self.metrics.timer('contacts_index'):
+                self._build_contact_matcher()
+            self.metrics.set_gauge('contacts_loaded', len(self.contacts_df))
+            self.metrics.set_gauge('contact_names_indexed', len(self.contact_names))
+            self.metrics.observe('load_contacts', time.perf_counter() - start, source=source)
             
             # Show summary
             print(f"✓ Contacts with email: {self.contacts_df['email'].notna().sum()}")
@@ -154,94 +2022,805 @@ class MediaStoryKeywordSearcher:
             
             return True
         except Exception as e:
+            self.metrics.incr('load_contacts_errors')
             print(f"❌ Error loading contacts file: {str(e)}")
             return False
     
-    def search_rss_feeds(self, days_back=7):
-        """Search RSS feeds for keywords"""
+    def _parse_contacts_workbook(self, contacts_path):
+        """Parse and normalize the Salesforce Excel export"""
+        import pandas as pd
+        
+        # Read the Excel file - the data starts at row 11 (0-indexed)
+        contacts_df = pd.read_excel(contacts_path, skiprows=10)
+        
+        # The first row contains empty cells and actual headers mixed
+        # We need to clean up the column names
+        # Based on the file structure, the actual columns are:
+        col_mapping = {
+            contacts_df.columns[1]: 'salutation',
+            contacts_df.columns[3]: 'firstname',
+            contacts_df.columns[4]: 'lastname',
+            contacts_df.columns[5]: 'title',
+            contacts_df.columns[6]: 'account_name',
+            contacts_df.columns[7]: 'mailing_street',
+            contacts_df.columns[8]: 'mailing_city',
+            contacts_df.columns[9]: 'mailing_state',
+            contacts_df.columns[10]: 'mailing_zip',
+            contacts_df.columns[11]: 'mailing_country',
+            contacts_df.columns[12]: 'phone',
+            contacts_df.columns[13]: 'fax',
+            contacts_df.columns[14]: 'mobile',
+            contacts_df.columns[15]: 'email',
+            contacts_df.columns[16]: 'account_owner'
+        }
+        
+        # Rename columns
+        contacts_df.rename(columns=col_mapping, inplace=True)
+        
+        # Drop rows where the first column contains header info
+        contacts_df = contacts_df[contacts_df['firstname'] != 'First Name'].copy()
+        
+        # Reset index
+        contacts_df.reset_index(drop=True, inplace=True)
+        
+        # Give text columns a real string type (phone/zip columns mix numbers
+        # and text, which columnar formats cannot store)
+        for column in contacts_df.columns:
+            if contacts_df[column].dtype == object:
+                contacts_df[column] = contacts_df[column].astype('string')
+        
+        # Create full name column (blank out NaN before joining so names
+        # containing "nan", e.g. "Nancy", are left intact)
+        contacts_df['full_name'] = (
+            contacts_df['firstname'].fillna('').astype(str).str.strip() + ' ' + 
+            contacts_df['lastname'].fillna('').astype(str).str.strip()
+        ).str.strip()
+        contacts_df['full_name_lower'] = contacts_df['full_name'].str.lower()
+        
+        # Precompute the token key used for name matching
+        contacts_df['name_key'] = contacts_df['full_name'].map(lambda name: ' '.join(tokenize(name)))
+        
+        return contacts_df
+    
+    @staticmethod
+    def _file_hash(path):
+        """SHA-1 of a file's contents"""
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _contacts_snapshot_base(contacts_path, snapshot_dir):
+        """Snapshot path prefix for a given workbook"""
+        abs_path = os.path.abspath(contacts_path)
+        stem = os.path.splitext(os.path.basename(contacts_path))[0]
+        return os.path.join(snapshot_dir, f"{stem}.{hashlib.sha1(abs_path.encode('utf-8')).hexdigest()[:12]}")
+    
+    def _read_contacts_snapshot(self, contacts_path, snapshot_dir, source_hash):
+        """Return the cached contacts table if it matches the workbook and snapshot version, else None"""
+        import pandas as pd
+        
+        base = self._contacts_snapshot_base(contacts_path, snapshot_dir)
+        try:
+            with open(base + '.meta.json', 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('source_hash') != source_hash or meta.get('version') != CONTACTS_SNAPSHOT_VERSION:
+                return None
+            if meta['format'] == 'parquet':
+                return pd.read_parquet(base + '.parquet')
+            return pd.read_pickle(base + '.pkl')
+        except Exception:
+            return None
+    
+    def _write_contacts_snapshot(self, contacts_path, snapshot_dir, source_hash):
+        """Save the normalized contacts table as Parquet (pickle without pyarrow)"""
+        base = self._contacts_snapshot_base(contacts_path, snapshot_dir)
+        try:
+            os.makedirs(snapshot_dir, exist_ok=True)
+            try:
+                self.contacts_df.to_parquet(base + '.parquet', index=False)
+                snapshot_format = 'parquet'
+            except ImportError:
+                self.contacts_df.to_pickle(base + '.pkl')
+                snapshot_format = 'pickle'
+            
+            # Metadata goes last so a partial write is never treated as valid
+            with open(base + '.meta.json', 'w', encoding='utf-8') as f:
+                json.dump({
+                    'source': os.path.abspath(contacts_path),
+                    'source_hash': source_hash,
+                    'version': CONTACTS_SNAPSHOT_VERSION,
+                    'format': snapshot_format,
+                    'rows': len(self.contacts_df),
+                    'created': datetime.now().isoformat()
+                }, f, indent=2)
+        except Exception as e:
+            print(f"⚠️  Could not write contacts snapshot: {str(e)}")
+    
+    def _build_contact_matcher(self):
+        """Index contact names (and their variants) so an article is matched in one pass"""
+        self.contact_names = []
+        self.contact_matcher = ContactNameIndex(variants=self.match_name_variants)
+        seen = set()
+        for contact_name, full_key, first_key, last_key in self._contact_keys():
+            if contact_name and len(contact_name) > 3 and contact_name not in seen:
+                seen.add(contact_name)
+                if self.contact_matcher.add(len(self.contact_names), full_key, first_key, last_key):
+                    self.contact_names.append(contact_name)
+        print(f"✓ Indexed {len(self.contact_names)} contact names for matching")
+    
+    def _contact_keys(self):
+        """Yield (full name, full/first/last name token tuples) for each loaded contact"""
+        if self.contacts_df is None:
+            return
+        rows = zip(self.contacts_df['full_name'], self.contacts_df['name_key'],
+                   self.contacts_df['firstname'].fillna('').astype(str),
+                   self.contacts_df['lastname'].fillna('').astype(str))
+        for contact_name, name_key, firstname, lastname in rows:
+            yield contact_name, tuple(name_key.split()), tuple(tokenize(firstname)), tuple(tokenize(lastname))
+    
+    def match_contacts(self, tokens, capitalized=()):
+        """Return the contact names found in a token list, in contacts order
+        (capitalized: positions of tokens written like names, see capitalized_positions)"""
+        if self.contact_matcher is None:
+            return []
+        return [self.contact_names[idx] for idx in sorted(self.contact_matcher.find(tokens, capitalized))]
+    
+    def _create_http_session(self):
+        """Create a pooled HTTP session shared by all feed fetches"""
+        return _pooled_session(self.fetch_workers, self.user_agent)
+    
+    def enable_feed_cache(self, cache_dir='feed_cache', max_bytes=50 * 1024 * 1024):
+        """Cache feeds on disk and poll them with conditional GETs"""
+        self.feed_cache = FeedCache(cache_dir, max_bytes)
+        return self.feed_cache
+    
+    def _fetch_feed(self, session, source_name, source_info):
+        """Fetch one RSS feed within the source's timeout and retry budget.
+        
+        Returns the feed's normalized entries. With a feed cache enabled the
+        request is conditional, and a 304 reuses the cached entries without
+        parsing anything.
+        """
+        import feedparser
+        import requests
+        
+        url = source_info['rss']
+        timeout = source_info.get('timeout', self.fetch_timeout)
+        retries = source_info.get('retries', self.fetch_retries)
+        
+        cached = self.feed_cache.get(url) if self.feed_cache is not None else None
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        metrics = self.metrics
+        for attempt in range(retries + 1):
+            if attempt:
+                metrics.incr('fetch_retries', source=source_name)
+            try:
+                with metrics.timer('fetch', source=source_name):
+                    response = session.get(url, timeout=timeout, headers=headers)
+                metrics.incr('http_responses', source=source_name, status=response.status_code)
+                metrics.incr('bytes_fetched', len(response.content), source=source_name)
+                if response.status_code == 304 and cached:
+                    return cached['entries']
+                if response.status_code < 500:
+                    response.raise_for_status()
+                    with metrics.timer('parse', source=source_name):
+                        feed = feedparser.parse(response.content)
+                        entries = [_normalize_entry(entry) for entry in feed.entries]
+                    if self.feed_cache is not None:
+                        self.feed_cache.put(url, response.headers.get('ETag'),
+                                            response.headers.get('Last-Modified'), entries)
+                    return entries
+                error = requests.HTTPError(f"{response.status_code} Server Error", response=response)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            
+            if attempt < retries:
+                time.sleep(self.fetch_backoff * (2 ** attempt))
+        
+        raise error
+    
+    def fetch_feeds(self, sources=None):
+        """Fetch RSS feeds concurrently.
+        
+        Returns a dict of source name -> list of entries (or the exception
+        raised while fetching it), ordered like self.media_sources regardless of
+        which fetch finishes first.
+        """
+        if sources is None:
+            sources = list(self.media_sources)
+        
+        fetched = {}
+        with self._create_http_session() as session:
+            with ThreadPoolExecutor(max_workers=max(1, min(len(sources), self.fetch_workers))) as executor:
+                futures = {
+                    executor.submit(self._fetch_feed, session, name, self.media_sources[name]): name
+                    for name in sources
+                }
+                for future in as_completed(futures):
+                    try:
+                        fetched[futures[future]] = future.result()
+                    except Exception as e:
+                        fetched[futures[future]] = e
+        
+        return {name: fetched[name] for name in sources}
+    
+    def enable_article_store(self, db_path='media_articles.db'):
+        """Persist processed entries so repeated runs only match new ones"""
+        self.article_store = ArticleStore(db_path)
+        return self.article_store
+    
+    def enable_result_stream(self, root_dir='media_search_results', format='jsonl', batch_size=1000):
+        """Append every new hit to a date/source-partitioned JSONL or Parquet export
+        
+        Pair it with the article store so each hit is exported exactly once;
+        without the store, every run re-exports all hits in its window.
+        """
+        self.result_stream = ResultStream(root_dir, format, batch_size)
+        return self.result_stream
+    
+    def enable_full_text(self, cache_path='article_text_cache.db', filter='keywords', max_fetch_attempts=3,
+                         **fetcher_options):
+        """Also match against the full article body for entries passing a first filter
+        
+        filter='keywords' fetches only entries whose title/summary already hit a
+        keyword (so contacts named deep in the story are found); filter='all'
+        fetches every new in-window entry. With the article store, an entry
+        whose body fails to download is retried on up to max_fetch_attempts
+        polls before it is matched without it. fetcher_options are passed to
+        ArticleTextFetcher (max_workers, per_host_interval, timeout, ...).
+        """
+        if filter not in ('keywords', 'all'):
+            raise ValueError(f"Unknown full text filter: {filter}")
+        fetcher_options.setdefault('user_agent', self.user_agent)
+        self.article_fetcher = ArticleTextFetcher(cache_path, metrics=self.metrics, **fetcher_options)
+        self.full_text_filter = filter
+        self.max_fetch_attempts = max_fetch_attempts
+        return self.article_fetcher
+    
+    def _process_entries(self, source_name, entries, cutoff_date):
+        """Match one source's feed entries (see _process_sources)
+        
+        Returns the hits and the number of in-window entries processed.
+        """
+        outcome = self._process_sources({source_name: entries}, cutoff_date)[source_name]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    def _process_sources(self, feeds, cutoff_date):
+        """Match feed entries against keywords and contacts
+        
+        feeds maps source names to entry iterables (or the exception their
+        fetch raised). Returns {source name: (hits, in-window entries
+        processed)}, with the exception instead for sources that failed.
+        With an article store enabled, entries already in the store are
+        skipped and every newly processed entry is recorded. Entries are
+        matched and recorded as they stream past, except that with full text
+        enabled those passing the first filter wait for their bodies, which
+        are fetched for all sources in one concurrent batch so per-host rate
+        limits overlap across sources.
+        """
+        fetcher = self.article_fetcher
+        states = {}
+        outcomes = {}
+        waiting = []
+        for source_name, entries in feeds.items():
+            try:
+                if isinstance(entries, Exception):
+                    raise entries
+                state = states[source_name] = {'results': [], 'processed': [], 'scanned': 0, 'in_window': 0,
+                                               'keyword_seconds': 0.0, 'contact_seconds': 0.0}
+                for candidate in self._scan_entries(entries, cutoff_date, state):
+                    if (fetcher is not None and candidate.entry.get('link')
+                            and (self.full_text_filter == 'all' or candidate.keywords)):
+                        waiting.append((source_name, candidate))
+                    else:
+                        self._record_candidate(source_name, candidate, state)
+            except Exception as e:
+                states.pop(source_name, None)
+                outcomes[source_name] = e
+        
+        if waiting:
+            self._fetch_bodies(waiting, states)
+            for source_name, candidate in waiting:
+                if source_name in states and not candidate.deferred:
+                    try:
+                        self._record_candidate(source_name, candidate, states[source_name])
+                    except Exception as e:
+                        states.pop(source_name)
+                        outcomes[source_name] = e
+        
+        for source_name, state in states.items():
+            try:
+                outcomes[source_name] = self._finish_source(source_name, state)
+            except Exception as e:
+                outcomes[source_name] = e
+        return {source_name: outcomes[source_name] for source_name in feeds}
+    
+    def _scan_entries(self, entries, cutoff_date, state):
+        """First pass: yield the new in-window entries, keyword-matched on title and summary"""
+        store = self.article_store
+        perf_counter = time.perf_counter
+        
+        if store is not None:
+            entries = list(entries)
+            keys = [ArticleStore.article_key(e.get('link', ''), e.get('id', '')) for e in entries]
+            seen = store.seen_keys(keys)
+        
+        for i, entry in enumerate(entries):
+            state['scanned'] += 1
+            key = None
+            if store is not None:
+                key = keys[i]
+                if key in seen:
+                    continue
+                seen.add(key)
+            
+            # Check if entry is recent enough
+            published_parsed = entry.get('published_parsed')
+            pub_date = None
+            if published_parsed:
+                pub_date = datetime(*published_parsed[:6])
+                if pub_date < cutoff_date:
+                    continue
+            
+            # Get entry content
+            title = entry.get('title', '').lower()
+            summary = entry.get('summary', '').lower()
+            content = title + ' ' + summary
+            tokens = tokenize(content)
+            # Original-case texts behind the tokens, for capitalized_positions
+            texts = [entry.get('title', ''), entry.get('summary', '')]
+            if entry.get('text'):
+                # Archived entries may already carry the article body
+                tokens += tokenize(entry['text'])
+                texts.append(entry['text'])
+            
+            # Check for keywords (single pass over the article)
+            start = perf_counter()
+            matching_keywords = self.match_keywords(tokens)
+            state['keyword_seconds'] += perf_counter() - start
+            yield _Candidate(key, entry, pub_date, tokens, matching_keywords, texts)
+    
+    def _fetch_bodies(self, waiting, states):
+        """Second pass: fetch and match the full bodies of (source name, candidate) pairs
+        
+        With an article store, entries whose body could not be downloaded
+        are deferred (neither reported nor stored) so a later poll retries
+        them, until max_fetch_attempts polls have failed; after that they
+        are matched on title and summary alone.
+        """
+        perf_counter = time.perf_counter
+        texts = self.article_fetcher.fetch_many([candidate.entry['link'] for _, candidate in waiting])
+        
+        failed = []
+        for source_name, candidate in waiting:
+            text = texts.get(candidate.entry['link'])
+            if text is None:
+                failed.append(candidate)
+            elif text:
+                candidate.tokens = candidate.tokens + tokenize(text)
+                candidate.texts = candidate.texts + [text]
+                start = perf_counter()
+                candidate.keywords = self.match_keywords(candidate.tokens)
+                if source_name in states:
+                    states[source_name]['keyword_seconds'] += perf_counter() - start
+        
+        store = self.article_store
+        if store is None or not failed:
+            return
+        attempts = store.fetch_failures(candidate.key for candidate in failed)
+        retry = [candidate for candidate in failed if attempts.get(candidate.key, 0) + 1 < self.max_fetch_attempts]
+        store.record_fetch_failures(candidate.key for candidate in retry)
+        for candidate in retry:
+            candidate.deferred = True
+        self.metrics.incr('article_fetch_deferred', len(retry))
+    
+    def _record_candidate(self, source_name, candidate, state):
+        """Last pass for one entry: match contacts, add the hit and queue the entry for the store"""
+        store = self.article_store
+        entry = candidate.entry
+        pub_date = candidate.pub_date
+        matching_keywords = candidate.keywords
+        contacts_mentioned = []
+        state['in_window'] += 1
+        capitalized = capitalized_positions(*candidate.texts) if store is not None or matching_keywords else ()
+        
+        if matching_keywords:
+            # Check for contact mentions across the full contact index
+            start = time.perf_counter()
+            contacts_mentioned = self.match_contacts(candidate.tokens, capitalized)
+            state['contact_seconds'] += time.perf_counter() - start
+            
+            result = self._add_result(
+                source_name,
+                entry.get('title') or 'No title',
+                entry.get('link', ''),
+                entry.get('published', 'Unknown'),
+                entry.get('summary', '')[:200] + '...',
+                matching_keywords,
+                contacts_mentioned,
+                pub_date.replace(tzinfo=timezone.utc) if pub_date else _parse_timestamp(entry.get('published'))
+            )
+            state['results'].append(result)
+        
+        if store is not None:
+            state['processed'].append({
+                'article_key': candidate.key,
+                'source': source_name,
+                'url': entry.get('link', ''),
+                'guid': entry.get('id', ''),
+                'title': entry.get('title', ''),
+                'published': entry.get('published', 'Unknown'),
+                'published_at': pub_date.isoformat() if pub_date else None,
+                'summary': entry.get('summary', ''),
+                'keywords_found': matching_keywords,
+                'contacts_mentioned': contacts_mentioned,
+                'tokens': candidate.tokens,
+                'capitalized': capitalized
+            })
+    
+    def _finish_source(self, source_name, state):
+        """Write a source's processed entries to the store and record its metrics"""
+        if state['processed']:
+            with self.metrics.timer('store_write', source=source_name):
+                self.article_store.add(state['processed'])
+        
+        metrics = self.metrics
+        metrics.incr('entries_scanned', state['scanned'], source=source_name)
+        metrics.incr('entries_in_window', state['in_window'], source=source_name)
+        metrics.incr('keyword_hits', len(state['results']), source=source_name)
+        metrics.observe('keyword_match', state['keyword_seconds'], source=source_name)
+        metrics.observe('contact_match', state['contact_seconds'], source=source_name)
+        
+        return state['results'], state['in_window']
+    
+    def load_results_from_store(self, days_back=None):
+        """Rebuild search_results and contact_mentions from the article store"""
+        self._reset_results()
+        since = _utc_now() - timedelta(days=days_back) if days_back is not None else None
+        
+        total = 0
+        for result in self.article_store.iter_matches(since):
+            self._add_result(**result, stream=False)
+            total += 1
+        self.results_since = since
+        self._store_window = (days_back, _utc_now().date())
+        return total
+    
+    def refresh_window(self, days_back):
+        """Reload the results from the article store when days_back or the UTC
+        date has changed since the last load, so hits age out of the window;
+        returns True if the results were reloaded"""
+        if self.article_store is None or self._store_window == (days_back, _utc_now().date()):
+            return False
+        self.load_results_from_store(days_back)
+        return True
+    
+    def _add_result(self, source, title, url, published, summary, keywords_found, contacts_mentioned,
+                    published_at=None, stream=True):
+        """Record a hit in the article table, search results, contact mentions and aggregates
+        
+        published_at is the parsed UTC publish time (None if unknown). New
+        hits (stream=True) are also queued on the result stream, if enabled.
+        """
+        record = self.articles.add(source, title, url, published, summary,
+                                   keywords_found, contacts_mentioned, published_at)
+        self.search_results[record.source].append(record)
+        for contact_name in contacts_mentioned:
+            self.contact_mentions[contact_name].append(record.article_id)
+        self.aggregates.add(record)
+        if stream and self.result_stream is not None:
+            self.result_stream.write(record)
+        return record
+    
+    def flush_result_stream(self):
+        """Write buffered hits to the result stream; returns how many were written"""
+        if self.result_stream is None:
+            return 0
+        with self.metrics.timer('write', output='stream'):
+            written = self.result_stream.flush()
+        self.metrics.incr('records_streamed', written)
+        return written
+    
+    def mentions_of(self, contact_name):
+        """Records of the articles mentioning a contact"""
+        return [self.articles[article_id] for article_id in self.contact_mentions.get(contact_name, ())]
+    
+    def _reset_results(self):
+        """Clear search results, contact mentions and their aggregates"""
+        self.articles = ResultTable()
+        self.search_results = defaultdict(list)
+        # contact name -> IDs of mentioning articles in self.articles
+        self.contact_mentions = defaultdict(lambda: array('I'))
+        self.aggregates = ResultAggregator()
+        self.results_since = None  # Publish date cutoff (naive UTC) of the results, None if unbounded
+        self._store_window = None  # (days_back, UTC date) of the results loaded from the store
+    
+    def rebuild_aggregates(self):
+        """Recompute the aggregates from search_results (after editing them by hand)"""
+        self.aggregates = ResultAggregator()
+        for articles in self.search_results.values():
+            for article in articles:
+                self.aggregates.add(article)
+        return self.aggregates
+    
+    def search_rss_feeds(self, days_back=7, sources=None):
+        """Search RSS feeds for keywords
+        
+        sources limits the run to some of self.media_sources. Per-source
+        outcomes are recorded in self.source_status. Without an article
+        store each call replaces the previous results; with one, the window
+        is loaded from the store once per UTC day (see refresh_window) and
+        new hits are added incrementally.
+        """
         print(f"\n🔍 Searching RSS feeds for {len(self.keywords)} keywords from the last {days_back} days...")
         print(f"Keywords include: {', '.join(self.keywords[:5])}... and {len(self.keywords)-5} more")
         
-        cutoff_date = datetime.now() - timedelta(days=days_back)
+        cutoff_date = _utc_now() - timedelta(days=days_back)
         total_found = 0
+        if self.article_store is None:
+            self._reset_results()
+            self.results_since = cutoff_date
+        else:
+            # Report on the whole window, including hits from earlier runs
+            self.refresh_window(days_back)
         
-        for source_name, source_info in self.media_sources.items():
+        # Fetch every source at once; match in source order so results are deterministic
+        run_start = time.perf_counter()
+        with self.metrics.timer('fetch_all'):
+            feeds = self.fetch_feeds(sources)
+        
+        # Match every source in one batch, so article bodies are fetched together
+        outcomes = self._process_sources(feeds, cutoff_date)
+        for source_name, outcome in outcomes.items():
             print(f"\nSearching {source_name}...")
+            status = {'checked': datetime.now().isoformat(), 'new_entries': 0, 'matches': 0, 'error': None}
+            self.source_status[source_name] = status
             try:
-                feed = feedparser.parse(source_info['rss'])
-                source_results = []
+                if isinstance(outcome, Exception):
+                    raise outcome
                 
-                for entry in feed.entries:
-                    # Check if entry is recent enough
-                    if hasattr(entry, 'published_parsed'):
-                        pub_date = datetime(*entry.published_parsed[:6])
-                        if pub_date < cutoff_date:
-                            continue
-                    
-                    # Get entry content
-                    title = entry.get('title', '').lower()
-                    summary = entry.get('summary', '').lower()
-                    content = title + ' ' + summary
-                    
-                    # Check for keywords
-                    matching_keywords = []
-                    for keyword in self.keywords:
-                        if keyword.lower() in content:
-                            matching_keywords.append(keyword)
-                    
-                    if matching_keywords:
-                        result = {
-                            'source': source_name,
-                            'title': entry.get('title', 'No title'),
-                            'url': entry.get('link', ''),
-                            'published': entry.get('published', 'Unknown'),
-                            'summary': entry.get('summary', '')[:200] + '...',
-                            'keywords_found': matching_keywords,
-                            'contacts_mentioned': []  # Changed from experts_mentioned
-                        }
-                        
-                        # Check for contact mentions
-                        if self.contacts_df is not None:
-                            # Only check a subset for performance (first 1000 contacts)
-                            for idx, contact in self.contacts_df.head(1000).iterrows():
-                                contact_name = contact.get('full_name', '')
-                                if contact_name and len(contact_name) > 3 and contact_name.lower() in content:
-                                    result['contacts_mentioned'].append(contact_name)
-                                    self.contact_mentions[contact_name].append(result)
-                        
-                        source_results.append(result)
-                        total_found += 1
+                source_results, new_entries = outcome
+                total_found += len(source_results)
+                status['new_entries'] = new_entries
+                status['matches'] = len(source_results)
                 
-                self.search_results[source_name] = source_results
-                print(f"✓ Found {len(source_results)} articles with keywords")
+                if self.article_store is None:
+                    print(f"✓ Found {len(source_results)} articles with keywords")
+                else:
+                    print(f"✓ Found {len(source_results)} new articles with keywords")
                 
             except Exception as e:
+                status['error'] = str(e)
+                self.metrics.incr('source_errors', source=source_name)
                 print(f"❌ Error searching {source_name}: {str(e)}")
         
+        self.flush_result_stream()
+        self.metrics.observe('search_rss_feeds', time.perf_counter() - run_start)
+        self.metrics.set_gauge('results_in_window', self.aggregates.total_articles)
+        
+        if self.article_store is not None:
+            print(f"\n✓ New articles found: {total_found} ({self.aggregates.total_articles} in the last {days_back} days)")
+            return total_found
+        
         print(f"\n✓ Total articles found: {total_found}")
         return total_found
     
-    def simulate_web_search(self, days_back=7):
-        """Simulate web search for keywords (in production, use actual APIs)"""
-        print(f"\n🔍 Simulating web search for keywords...")
+    def backfill_archives(self, paths, processes=None, since=None, until=None, shard_bytes=16 * 1024 * 1024):
+        """Scan archived feeds and article dumps instead of live RSS
         
-        # In production, this would use:
-        # - Google Custom Search API
-        # - Bing News Search API
-        # - NewsAPI.org
-        # - Individual media outlet APIs
+        paths may be archive files or directories of them (see read_archive).
+        Files (uncompressed JSONL dumps in shard_bytes chunks) are sharded
+        across a process pool whose workers receive the compiled keyword and
+        contact matchers once at startup. Hits are merged in shard order and
+        deduplicated by URL, so the results are identical to a
+        single-process run (processes=1). since/until limit
+        entries by publish date (naive values are taken as UTC). Replaces
+        the current search results. With the article store enabled, every
+        entry scanned (with its tokens) is added to it by this process, so
+        query_history covers the archives too.
+        """
+        # Feed dates are naive UTC, so compare against naive UTC bounds
+        since, until = [bound.astimezone(timezone.utc).replace(tzinfo=None) if bound and bound.tzinfo else bound
+                        for bound in (since, until)]
+        files = iter_archive_files(paths)
+        processes = processes or os.cpu_count() or 1
+        print(f"\n📦 Backfilling {len(files)} archive files with {processes} processes...")
         
-        print("\n⚠️  Note: This is a simulation. In production, implement actual API calls to:")
-        print("   - Google Custom Search API")
-        print("   - Bing News Search API")
-        print("   - NewsAPI.org")
-        print("   - Individual media outlet APIs")
+        state = {
+            'keywords': self.keywords,
+            'keyword_matcher': self.keyword_matcher,
+            'contact_names': self.contact_names,
+            'contact_matcher': self.contact_matcher,
+            'full_text_filter': self.full_text_filter,
+            '_host_sources': _host_sources(self.media_sources)
+        }
+        store = self.article_store
+        tasks = [(path, byte_range, since, until, store is not None)
+                 for path, byte_range in _archive_shards(files, shard_bytes)]
         
-        # For now, we'll skip the simulation since it's not providing real data
-        return
+        self._reset_results()
+        self.results_since = since
+        seen_articles = set()
+        scanned = 0
+        start = time.perf_counter()
+        
+        if processes == 1 or len(tasks) <= 1:
+            _init_backfill_worker(state)
+            shard_results = map(_backfill_file, tasks)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=processes, initializer=_init_backfill_worker,
+                                           initargs=(state,))
+            shard_results = executor.map(_backfill_file, tasks)
+        
+        try:
+            # map() yields in task order, so merging is deterministic
+            for path, total, hits, entries in shard_results:
+                scanned += total
+                for result in hits:
+                    dedupe_key = result['url'] or (result['source'], result['title'])
+                    if dedupe_key in seen_articles:
+                        continue
+                    seen_articles.add(dedupe_key)
+                    self._add_result(**result)
+                if entries:
+                    with self.metrics.timer('store_write', source='backfill'):
+                        store.add(entries)
+                self.metrics.incr('backfill_shards')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.flush_result_stream()
+        
+        elapsed = time.perf_counter() - start
+        self.metrics.incr('backfill_entries', scanned)
+        self.metrics.observe('backfill', elapsed)
+        print(f"✓ Scanned {scanned} entries in {elapsed:.1f}s; {self.aggregates.total_articles} articles with keywords")
+        return self.aggregates.total_articles
+    
+    def query_history(self, keywords=None, contacts=None, days_back=None):
+        """Match keywords and contacts retroactively against every stored article
+        
+        The article store's inverted index narrows the search to articles
+        containing every word of some keyword (and of some contact name or
+        surname); only those are re-matched, on the same tokens and with the
+        same matchers as search_rss_feeds. keywords defaults to
+        self.keywords. Without contacts, hits list the loaded contacts they
+        mention; with a list of contact names, only hits mentioning one of
+        them are kept (names not among the loaded contacts are matched as
+        "First ... Last"). The hits replace the current results, ready for
+        the report, export and dashboard writers. Returns the number of hits.
+        """
+        if self.article_store is None:
+            print("❌ Article store not enabled; there is no history to query")
+            return 0
+        start = time.perf_counter()
+        keywords = list(self.keywords if keywords is None else keywords)
+        keyword_matcher = PhraseMatcher()
+        for idx, keyword in enumerate(keywords):
+            keyword_matcher.add(keyword, idx)
+        
+        name_index = None
+        if contacts is not None:
+            known = {name: keys for name, *keys in self._contact_keys()}
+            name_index = ContactNameIndex(variants=self.match_name_variants)
+            names = []
+            for name in contacts:
+                keys = known.get(name)
+                if keys is None:
+                    tokens = tuple(tokenize(name))
+                    keys = (tokens, tokens[:1], tokens[-1:] if len(tokens) > 1 else ())
+                if name_index.add(len(names), *keys):
+                    names.append(name)
+        
+        store = self.article_store
+        candidates = store.articles_containing(list(keyword_matcher.keys()))
+        if name_index is not None:
+            candidates &= store.articles_containing(name_index.blocking_keys())
+        
+        self._reset_results()
+        since = _utc_now() - timedelta(days=days_back) if days_back is not None else None
+        self.results_since = since
+        for entry, tokens, capitalized in store.iter_indexed(candidates, since):
+            matching_keywords = [keywords[idx] for idx in sorted(keyword_matcher.find(tokens))]
+            if not matching_keywords:
+                continue
+            if name_index is None:
+                contacts_mentioned = self.match_contacts(tokens, capitalized)
+            else:
+                contacts_mentioned = [names[idx] for idx in sorted(name_index.find(tokens, capitalized))]
+                if not contacts_mentioned:
+                    continue
+            self._add_result(entry['source'], entry['title'] or 'No title', entry['url'], entry['published'],
+                             (entry['summary'] or '')[:200] + '...', matching_keywords, contacts_mentioned,
+                             entry['published_at'], stream=False)
+        
+        elapsed = time.perf_counter() - start
+        self.metrics.observe('query_history', elapsed)
+        self.metrics.incr('history_candidates', len(candidates))
+        print(f"✓ {self.aggregates.total_articles} stored articles match "
+              f"({len(candidates)} candidates checked in {elapsed * 1000:.0f} ms)")
+        return self.aggregates.total_articles
+    
+    def enable_web_search(self, provider, cache_path='search_cache.db', max_workers=4, cache_ttl=3600, max_pages=3):
+        """Search a news API (a SearchProvider) for the keywords in search_web"""
+        self.web_search = WebSearchBackend(provider, cache_path, max_workers, cache_ttl, self.metrics, max_pages)
+        return self.web_search
+    
+    def search_web(self, days_back=7):
+        """Search the web search backend for every keyword and add its new hits
+        
+        Keywords are packed into a few OR-queries (see pack_queries). Hits
+        are credited to the media source hosting them when the domain is
+        known, deduplicated by URL against the current results (e.g. RSS
+        hits) and then matched like feed entries, so they get the same
+        keyword and contact checks, article store and result stream
+        handling. Returns the number of new hits.
+        """
+        if self.web_search is None:
+            print("\n⚠️  No web search backend enabled; skipping web search")
+            return 0
+        provider = self.web_search.provider
+        print(f"\n🔍 Searching {provider.name} for {len(self.keywords)} keywords...")
+        
+        start = time.perf_counter()
+        self.refresh_window(days_back)
+        responses = self.web_search.search(self.keywords, days_back)
+        
+        known_urls = {record.url for record in self.articles if record.url}
+        host_sources = _host_sources(self.media_sources)
+        by_source = defaultdict(list)
+        returned = duplicates = 0
+        for entries in responses.values():
+            for entry in entries:
+                returned += 1
+                url = entry['link']
+                if not url or url in known_urls:
+                    duplicates += 1
+                    continue
+                known_urls.add(url)
+                by_source[_source_for_url(url, host_sources, entry.get('source') or provider.name)].append(entry)
+        
+        cutoff_date = _utc_now() - timedelta(days=days_back)
+        total_found = 0
+        for source_name, outcome in self._process_sources(by_source, cutoff_date).items():
+            if isinstance(outcome, Exception):
+                print(f"❌ Error matching {source_name} web results: {str(outcome)}")
+                continue
+            total_found += len(outcome[0])
+        self.flush_result_stream()
+        
+        self.metrics.incr('web_search_duplicates', duplicates, provider=provider.name)
+        self.metrics.observe('search_web', time.perf_counter() - start, provider=provider.name)
+        self.metrics.set_gauge('results_in_window', self.aggregates.total_articles)
+        print(f"✓ {len(responses)} queries returned {returned} articles ({duplicates} duplicates); "
+              f"{total_found} new articles with keywords")
+        return total_found
+    
+    def _record_write(self, output, start, paths):
+        """Record an output writer's duration and bytes written"""
+        self.metrics.observe('write', time.perf_counter() - start, output=output)
+        for path in paths:
+            try:
+                self.metrics.incr('bytes_written', os.path.getsize(path), output=output)
+            except OSError:
+                pass
     
     def generate_keyword_report(self, output_path='media_keyword_analysis.md'):
         """Generate comprehensive keyword analysis report"""
+        start = time.perf_counter()
+        stats = self.aggregates
         report = []
         
         # Header
@@ -252,33 +2831,22 @@ class MediaStoryKeywordSearcher:
             report.append(f"**Total contacts in database:** {len(self.contacts_df)}")
         
         # Executive Summary
-        total_articles = sum(len(articles) for articles in self.search_results.values())
-        total_contact_mentions = sum(len(mentions) for mentions in self.contact_mentions.values())
-        
         report.append(f"\n## Executive Summary")
-        report.append(f"- Total articles found: {total_articles}")
+        report.append(f"- Total articles found: {stats.total_articles}")
         report.append(f"- Media outlets searched: {len(self.media_sources)}")
         report.append(f"- Keywords tracked: {len(self.keywords)}")
-        report.append(f"- Contact mentions found: {total_contact_mentions}")
+        report.append(f"- Contact mentions found: {stats.total_contact_mentions}")
         
         # Coverage by Keyword
         report.append("\n## Coverage Analysis by Keyword\n")
-        keyword_stats = defaultdict(int)
-        keyword_sources = defaultdict(set)
-        
-        for source, articles in self.search_results.items():
-            for article in articles:
-                for keyword in article['keywords_found']:
-                    keyword_stats[keyword] += 1
-                    keyword_sources[keyword].add(source)
         
         # Sort keywords by frequency
-        sorted_keywords = sorted(keyword_stats.items(), key=lambda x: x[1], reverse=True)
+        sorted_keywords = sorted(stats.keyword_counts.items(), key=lambda x: x[1], reverse=True)
         
         if sorted_keywords:
             report.append("### Most Frequently Found Keywords")
             for keyword, count in sorted_keywords[:20]:  # Top 20 most found
-                sources = keyword_sources.get(keyword, set())
+                sources = stats.keyword_sources.get(keyword, set())
                 report.append(f"\n**{keyword}**")
                 report.append(f"- Articles found: {count}")
                 report.append(f"- Media outlets covering: {len(sources)}")
@@ -289,7 +2857,7 @@ class MediaStoryKeywordSearcher:
                 report.append(f"\n*... and {len(sorted_keywords) - 20} more keywords with matches*")
         
         # Keywords not found
-        not_found = [kw for kw in self.keywords if kw not in keyword_stats]
+        not_found = [kw for kw in self.keywords if kw not in stats.keyword_counts]
         if not_found:
             report.append(f"\n### Keywords Not Found in Recent Coverage ({len(not_found)} total)")
             report.append(", ".join(not_found[:20]))
@@ -298,187 +2866,588 @@ class MediaStoryKeywordSearcher:
         
         # Coverage by Media Outlet
         report.append("\n## Coverage by Media Outlet\n")
-        for source, articles in sorted(self.search_results.items()):
-            if articles:
-                report.append(f"### {source}")
-                report.append(f"*{len(articles)} articles found*\n")
-                
-                # Show first 5 articles
-                for article in articles[:5]:
-                    report.append(f"**{article['title']}**")
-                    report.append(f"- Published: {article['published']}")
-                    report.append(f"- Keywords: {', '.join(article['keywords_found'])}")
-                    if article['contacts_mentioned']:
-                        report.append(f"- Contacts mentioned: {', '.join(article['contacts_mentioned'])}")
-                    report.append(f"- [Link]({article['url']})")
-                    report.append("")
-                
-                if len(articles) > 5:
-                    report.append(f"*... and {len(articles) - 5} more articles*\n")
+        for source, article_count in sorted(stats.source_counts.items()):
+            report.append(f"### {source}")
+            report.append(f"*{article_count} articles found*\n")
+            
+            # Show first 5 articles
+            for article in stats.source_samples[source]:
+                report.append(f"**{article['title']}**")
+                report.append(f"- Published: {article['published']}")
+                report.append(f"- Keywords: {', '.join(article['keywords_found'])}")
+                if article['contacts_mentioned']:
+                    report.append(f"- Contacts mentioned: {', '.join(article['contacts_mentioned'])}")
+                report.append(f"- [Link]({article['url']})")
+                report.append("")
+            
+            if article_count > 5:
+                report.append(f"*... and {article_count - 5} more articles*\n")
         
         # Contact Mentions
-        if self.contact_mentions:
+        if stats.contact_counts:
             report.append("\n## Salesforce Contact Media Mentions\n")
             report.append("*Contacts from your database mentioned in media coverage:*\n")
             
-            for contact, mentions in sorted(self.contact_mentions.items(), 
-                                         key=lambda x: len(x[1]), reverse=True):
+            for contact, mention_count in sorted(stats.contact_counts.items(), 
+                                                 key=lambda x: x[1], reverse=True):
                 report.append(f"### {contact}")
-                report.append(f"*Mentioned in {len(mentions)} articles*\n")
+                report.append(f"*Mentioned in {mention_count} articles*\n")
                 
-                for mention in mentions[:3]:
+                for mention in stats.contact_samples[contact]:
                     report.append(f"- **{mention['title']}** ({mention['source']})")
                 
-                if len(mentions) > 3:
-                    report.append(f"- *... and {len(mentions) - 3} more mentions*")
+                if mention_count > 3:
+                    report.append(f"- *... and {mention_count - 3} more mentions*")
                 report.append("")
         
         # Save report
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write('\n'.join(report))
         
+        self._record_write('report', start, [output_path])
         print(f"\n✓ Keyword analysis report saved to: {output_path}")
         return output_path
     
-    def export_search_results(self, output_prefix='media_search_results'):
-        """Export search results to CSV/Excel"""
-        all_results = []
-        
-        for source, articles in self.search_results.items():
-            for article in articles:
-                record = {
-                    'source': source,
-                    'title': article['title'],
-                    'url': article['url'],
-                    'published': article['published'],
-                    'summary': article['summary'],
-                    'keywords_found': ', '.join(article['keywords_found']),
-                    'contacts_mentioned': ', '.join(article['contacts_mentioned']),
-                    'num_keywords': len(article['keywords_found']),
-                    'has_contact_mention': len(article['contacts_mentioned']) > 0
-                }
-                all_results.append(record)
+    def export_search_results(self, output_prefix='media_search_results', xlsx=True, xlsx_max_rows=10000):
+        """Export search results to CSV/Excel
         
-        if all_results:
-            df = pd.DataFrame(all_results)
-            df.to_csv(f'{output_prefix}.csv', index=False)
-            df.to_excel(f'{output_prefix}.xlsx', index=False)
-            print(f"✓ Search results exported to {output_prefix}.csv and .xlsx")
-        else:
+        The CSV is written row by row. The Excel workbook is an optional
+        summary: keyword and source sheets taken from the shared aggregates
+        plus at most xlsx_max_rows results. For an append-only export of
+        every hit, see enable_result_stream.
+        """
+        start = time.perf_counter()
+        if not self.aggregates.total_articles:
             print("❌ No results to export")
+            return
+        
+        columns = ['source', 'title', 'url', 'published', 'summary', 'keywords_found',
+                   'contacts_mentioned', 'num_keywords', 'has_contact_mention']
+        xlsx_rows = []
+        with open(f'{output_prefix}.csv', 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(columns)
+            for source, articles in self.search_results.items():
+                for article in articles:
+                    keywords = article['keywords_found']
+                    contacts = article['contacts_mentioned']
+                    row = [source, article['title'], article['url'], article['published'], article['summary'],
+                           ', '.join(keywords), ', '.join(contacts), len(keywords), len(contacts) > 0]
+                    writer.writerow(row)
+                    if xlsx and len(xlsx_rows) < xlsx_max_rows:
+                        xlsx_rows.append(row)
+        paths = [f'{output_prefix}.csv']
+        
+        if xlsx:
+            import pandas as pd
+            
+            stats = self.aggregates
+            keyword_df = pd.DataFrame([
+                {'keyword': keyword, 'articles': count,
+                 'outlets': ', '.join(sorted(stats.keyword_sources[keyword]))}
+                for keyword, count in stats.keyword_counts.most_common()
+            ])
+            source_df = pd.DataFrame([
+                {'source': source, 'articles': count, 'keywords_covered': len(stats.source_keywords[source])}
+                for source, count in stats.source_counts.most_common()
+            ])
+            with pd.ExcelWriter(f'{output_prefix}.xlsx') as writer:
+                pd.DataFrame(xlsx_rows, columns=columns).to_excel(writer, sheet_name='Results', index=False)
+                keyword_df.to_excel(writer, sheet_name='Keywords', index=False)
+                source_df.to_excel(writer, sheet_name='Sources', index=False)
+            paths.append(f'{output_prefix}.xlsx')
+            if stats.total_articles > len(xlsx_rows):
+                print(f"⚠️  Excel Results sheet limited to the first {len(xlsx_rows)} of {stats.total_articles} "
+                      f"articles (all are in {output_prefix}.csv)")
+        
+        self._record_write('export', start, paths)
+        print(f"✓ Search results exported to {' and '.join(paths)}")
     
-    def create_keyword_dashboard_data(self, output_path='keyword_dashboard_data.json'):
-        """Create data for visualization dashboard"""
+    def create_keyword_dashboard_data(self, output_path='keyword_dashboard_data.json', windows=None):
+        """Create data for visualization dashboard
+        
+        windows maps names to lengths in seconds (default DASHBOARD_WINDOWS:
+        24h, 7d and 90d); each is summarized from time rollups, so the cost
+        does not grow with history. Results loaded from the article store
+        use its rollups, which cover every stored hit; otherwise windows
+        reaching back past the results' cutoff are cut short to it.
+        """
+        start = time.perf_counter()
+        stats = self.aggregates
+        windows = DASHBOARD_WINDOWS if windows is None else windows
+        now = time.time()
+        store = self.article_store if self._store_window is not None else None
+        window_seconds = {}
+        for name, seconds in windows.items():
+            if store is None and self.results_since is not None:
+                covered = now - self.results_since.replace(tzinfo=timezone.utc).timestamp()
+                if seconds > covered:
+                    print(f"⚠️  Dashboard window {name} is longer than the results cover "
+                          f"({covered / 86400:.1f} days); summarizing those days only")
+                    seconds = covered
+            window_seconds[name] = seconds
         dashboard_data = {
             'generated': datetime.now().isoformat(),
             'keywords': self.keywords,
             'summary': {
-                'total_articles': sum(len(articles) for articles in self.search_results.values()),
-                'total_sources': len([s for s, articles in self.search_results.items() if articles]),
-                'total_contact_mentions': sum(len(mentions) for mentions in self.contact_mentions.values())
+                'total_articles': stats.total_articles,
+                'total_sources': len(stats.source_counts),
+                'total_contact_mentions': stats.total_contact_mentions,
+                'undated_articles': stats.undated_articles
             },
-            'keyword_metrics': {},
-            'source_metrics': {},
-            'timeline': defaultdict(lambda: defaultdict(int)),
-            'contact_visibility': {}
-        }
-        
-        # Calculate metrics
-        for source, articles in self.search_results.items():
-            for article in articles:
-                # Keyword metrics
-                for keyword in article['keywords_found']:
-                    if keyword not in dashboard_data['keyword_metrics']:
-                        dashboard_data['keyword_metrics'][keyword] = {
-                            'count': 0,
-                            'sources': set()
-                        }
-                    dashboard_data['keyword_metrics'][keyword]['count'] += 1
-                    dashboard_data['keyword_metrics'][keyword]['sources'].add(source)
-                
-                # Source metrics
-                if source not in dashboard_data['source_metrics']:
-                    dashboard_data['source_metrics'][source] = {
-                        'total_articles': 0,
-                        'keywords_covered': set()
-                    }
-                dashboard_data['source_metrics'][source]['total_articles'] += 1
-                dashboard_data['source_metrics'][source]['keywords_covered'].update(article['keywords_found'])
-                
-                # Timeline data
-                try:
-                    pub_date = article['published'][:10]  # Get YYYY-MM-DD
-                    for keyword in article['keywords_found']:
-                        dashboard_data['timeline'][pub_date][keyword] += 1
-                except:
-                    pass
-        
-        # Contact visibility
-        for contact, mentions in self.contact_mentions.items():
-            dashboard_data['contact_visibility'][contact] = {
-                'mention_count': len(mentions),
-                'sources': list(set(m['source'] for m in mentions))
+            'keyword_metrics': {
+                keyword: {'count': count, 'sources': list(stats.keyword_sources[keyword])}
+                for keyword, count in stats.keyword_counts.items()
+            },
+            'source_metrics': {
+                source: {'total_articles': count, 'keywords_covered': list(stats.source_keywords[source])}
+                for source, count in stats.source_counts.items()
+            },
+            'timeline': stats.timeline(),
+            'windows': {name: stats.window_summary(seconds, now, store) for name, seconds in window_seconds.items()},
+            'contact_visibility': {
+                contact: {'mention_count': count, 'sources': list(stats.contact_sources[contact])}
+                for contact, count in stats.contact_counts.items()
             }
-        
-        # Convert sets to lists for JSON serialization
-        for keyword in dashboard_data['keyword_metrics']:
-            dashboard_data['keyword_metrics'][keyword]['sources'] = list(
-                dashboard_data['keyword_metrics'][keyword]['sources']
-            )
-        for source in dashboard_data['source_metrics']:
-            dashboard_data['source_metrics'][source]['keywords_covered'] = list(
-                dashboard_data['source_metrics'][source]['keywords_covered']
-            )
+        }
         
         # Save dashboard data
         with open(output_path, 'w') as f:
             json.dump(dashboard_data, f, indent=2, default=str)
         
+        self._record_write('dashboard', start, [output_path])
         print(f"✓ Dashboard data saved to {output_path}")
         return dashboard_data
 
 
-# Main execution
-if __name__ == "__main__":
+class AdaptivePollScheduler:
+    """Per-source poll intervals that follow each feed's publishing rate.
+
+    Each source keeps a smoothed estimate of new items per second; its
+    interval is set so a poll is expected to find about target_items new
+    items, clamped to [min_interval, max_interval]. Failed polls back off
+    exponentially up to max_backoff.
+    """
+
+    def __init__(self, sources, initial_interval=600, min_interval=120, max_interval=3600,
+                 max_backoff=6 * 3600, target_items=1.0, smoothing=0.3):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_backoff = max_backoff
+        self.target_items = target_items
+        self.smoothing = smoothing
+        now = time.time()
+        self.state = {
+            name: {'interval': initial_interval, 'next_due': now, 'last_success': None,
+                   'rate': None, 'errors': 0}
+            for name in sources
+        }
+
+    def due(self, now=None):
+        """Sources whose next poll time has passed, in source order"""
+        now = time.time() if now is None else now
+        return [name for name, state in self.state.items() if state['next_due'] <= now]
+
+    def next_due(self):
+        """Earliest time any source is due"""
+        return min(state['next_due'] for state in self.state.values())
+
+    def record_success(self, name, new_items, now=None):
+        """Update a source's rate estimate and schedule its next poll"""
+        now = time.time() if now is None else now
+        state = self.state[name]
+        state['errors'] = 0
+
+        if state['last_success'] is not None:
+            elapsed = max(now - state['last_success'], 1.0)
+            observed = new_items / elapsed
+            if state['rate'] is None:
+                state['rate'] = observed
+            else:
+                state['rate'] = self.smoothing * observed + (1 - self.smoothing) * state['rate']
+            if state['rate'] > 0:
+                interval = self.target_items / state['rate']
+            else:
+                interval = self.max_interval
+            state['interval'] = min(self.max_interval, max(self.min_interval, interval))
+        state['last_success'] = now
+        state['next_due'] = now + state['interval']
+
+    def record_error(self, name, now=None):
+        """Back off a failing source exponentially"""
+        now = time.time() if now is None else now
+        state = self.state[name]
+        state['errors'] += 1
+        delay = min(self.max_backoff, state['interval'] * (2 ** state['errors']))
+        state['next_due'] = now + delay
+
+
+class MediaWatchService:
+    """Unattended polling loop around MediaStoryKeywordSearcher.
+
+    Only sources that are due are fetched each cycle, the searcher (and its
+    loaded contacts) stays in memory between cycles, and the report, export
+    and dashboard files are rewritten only when new hits arrive or the
+    window moves on (the results are reloaded from the article store each
+    UTC day, dropping hits older than days_back). Polling needs the
+    searcher's article store; write_outputs works without one.
+    """
+
+    def __init__(self, searcher, days_back=7, scheduler=None, contacts_path=None,
+                 report_path='media_keyword_analysis.md', export_prefix='media_search_results',
+                 dashboard_path='keyword_dashboard_data.json', metrics_path='arc_metrics',
+                 xlsx_max_rows=10000, dashboard_windows=None):
+        self.searcher = searcher
+        self.days_back = days_back
+        self.scheduler = scheduler or AdaptivePollScheduler(searcher.media_sources)
+        self.contacts_path = contacts_path
+        self.report_path = report_path
+        self.export_prefix = export_prefix
+        self.dashboard_path = dashboard_path
+        self.metrics_path = metrics_path
+        self.xlsx_max_rows = xlsx_max_rows
+        self.dashboard_windows = dashboard_windows
+        self._contacts_mtime = None
+        self._stop = threading.Event()
+
+    def stop(self, *args):
+        """Ask the loop to exit after the current cycle"""
+        self._stop.set()
+
+    def _refresh_contacts(self):
+        """Reload contacts only when the workbook has changed on disk"""
+        if not self.contacts_path:
+            return
+        try:
+            mtime = os.path.getmtime(self.contacts_path)
+        except OSError:
+            return
+        if mtime != self._contacts_mtime:
+            if self.searcher.load_contacts(self.contacts_path):
+                self._contacts_mtime = mtime
+
+    def write_outputs(self):
+        """Regenerate the report, export and dashboard files (None skips one)"""
+        if self.report_path:
+            self.searcher.generate_keyword_report(self.report_path)
+        if self.export_prefix:
+            self.searcher.export_search_results(self.export_prefix, xlsx=self.xlsx_max_rows > 0,
+                                                xlsx_max_rows=self.xlsx_max_rows)
+        if self.dashboard_path:
+            self.searcher.create_keyword_dashboard_data(self.dashboard_path, self.dashboard_windows)
+
+    def run_once(self):
+        """Poll every due source once; returns the number of new hits"""
+        if self.searcher.article_store is None:
+            # Without the store each poll of a few due sources would replace
+            # every other source's hits and count every entry as new
+            raise ValueError("Watch mode needs the article store (enable_article_store)")
+        self._refresh_contacts()
+        window_moved = self.searcher.refresh_window(self.days_back)
+        due = self.scheduler.due()
+        if not due:
+            if window_moved:
+                self.write_outputs()
+            return 0
+
+        new_hits = self.searcher.search_rss_feeds(days_back=self.days_back, sources=due)
+        for name in due:
+            status = self.searcher.source_status.get(name, {})
+            if status.get('error'):
+                self.scheduler.record_error(name)
+            else:
+                self.scheduler.record_success(name, status.get('new_entries', 0))
+
+        if new_hits or window_moved:
+            self.write_outputs()
+        if self.metrics_path:
+            self.searcher.metrics.write(self.metrics_path)
+        return new_hits
+
+    def run(self, max_cycles=None):
+        """Poll until stopped (SIGINT/SIGTERM) or max_cycles is reached"""
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        print(f"\n👀 Watching {len(self.scheduler.state)} sources (Ctrl+C to stop)...")
+        cycles = 0
+        while not self._stop.is_set():
+            self.run_once()
+            cycles += 1
+            if max_cycles is not None and cycles >= max_cycles:
+                break
+            self._stop.wait(max(1.0, self.scheduler.next_due() - time.time()))
+        print("\n✓ Watch mode stopped")
+
+
+OUTPUT_CHOICES = ('report', 'export', 'dashboard')
+
+
+def _comma_list(value):
+    """argparse type for comma-separated lists ("CNN, Fox News")"""
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def _add_output_options(parser):
+    """Contacts, output selection and output path options"""
+    parser.add_argument('--contacts', metavar='PATH', help="Salesforce contacts workbook to match names against")
+    parser.add_argument('--outputs', type=_comma_list, default=list(OUTPUT_CHOICES), metavar='LIST',
+                        help="outputs to write: any of report,export,dashboard, or none (default: all)")
+    parser.add_argument('--report', default='media_keyword_analysis.md', metavar='PATH',
+                        help="keyword report path (default: %(default)s)")
+    parser.add_argument('--export-prefix', default='media_search_results', metavar='PREFIX',
+                        help="CSV/XLSX export prefix (default: %(default)s)")
+    parser.add_argument('--xlsx-max-rows', type=int, default=10000, metavar='N',
+                        help="cap on the XLSX Results sheet, 0 to skip the workbook (default: %(default)s)")
+    parser.add_argument('--stream', choices=ResultStream.FORMATS,
+                        help="also append each new hit to a date/source-partitioned export")
+    parser.add_argument('--stream-dir', default='media_search_results', metavar='DIR',
+                        help="root directory of the streamed export (default: %(default)s)")
+    parser.add_argument('--dashboard', default='keyword_dashboard_data.json', metavar='PATH',
+                        help="dashboard JSON path (default: %(default)s)")
+    parser.add_argument('--dashboard-windows', type=_comma_list, default=list(DASHBOARD_WINDOWS), metavar='LIST',
+                        help="recent windows summarized in the dashboard (default: 24h,7d,90d)")
+    parser.add_argument('--metrics', default='arc_metrics', metavar='PREFIX',
+                        help="metrics file prefix for .json and .prom, '' to skip (default: %(default)s)")
+
+
+def _add_feed_options(parser):
+    """Options for the commands that poll live RSS feeds"""
+    parser.add_argument('--days-back', type=int, default=7, help="search window in days (default: 7)")
+    parser.add_argument('--sources', type=_comma_list, metavar='LIST',
+                        help="comma-separated source names to poll (default: all, see 'sources')")
+    parser.add_argument('--db', default='media_articles.db', metavar='PATH',
+                        help="article store path (default: %(default)s)")
+    parser.add_argument('--no-store', action='store_true', help="do not keep an article store between runs")
+    parser.add_argument('--no-cache', action='store_true', help="do not cache feeds or send conditional GETs")
+    parser.add_argument('--full-text', choices=['keywords', 'all'],
+                        help="also match article bodies for keyword hits or for all new entries")
+
+
+def build_arg_parser():
+    """Command-line interface; building it imports nothing heavy"""
+    parser = argparse.ArgumentParser(
+        prog='ARC_new.py',
+        description="Search media outlets for sensitive keywords and contact mentions. "
+                    "Runs the interactive prompts when no command is given."
+    )
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND')
+
+    search = commands.add_parser('search', help="poll the feeds once and write the outputs")
+    _add_feed_options(search)
+    _add_output_options(search)
+    search.add_argument('--web-search', choices=sorted(SEARCH_PROVIDERS),
+                        help="also query a news search API (newsapi reads $NEWSAPI_KEY)")
+    search.add_argument('--stub-corpus', metavar='PATH',
+                        help="JSONL articles answering --web-search stub queries")
+    search.add_argument('--search-cache', default='search_cache.db', metavar='PATH',
+                        help="web search response cache (default: %(default)s)")
+    search.add_argument('--search-pages', type=int, default=3, metavar='N',
+                        help="result pages read per web search query (default: %(default)s)")
+
+    watch = commands.add_parser('watch', help="keep polling the feeds as a long-lived service")
+    _add_feed_options(watch)
+    _add_output_options(watch)
+    watch.add_argument('--min-interval', type=int, default=120, help="shortest poll interval per source, seconds")
+    watch.add_argument('--max-interval', type=int, default=3600, help="longest poll interval per source, seconds")
+
+    backfill = commands.add_parser('backfill', help="scan archived feeds and article dumps")
+    backfill.add_argument('paths', nargs='+', metavar='PATH', help="archive files or directories of them")
+    backfill.add_argument('--processes', type=int, help="worker processes (default: CPU count)")
+    backfill.add_argument('--since', type=datetime.fromisoformat, metavar='DATE',
+                          help="skip entries published before this ISO date")
+    backfill.add_argument('--until', type=datetime.fromisoformat, metavar='DATE',
+                          help="skip entries published on or after this ISO date")
+    backfill.add_argument('--db', default='media_articles.db', metavar='PATH',
+                          help="article store to add the archived entries to, for 'query' (default: %(default)s)")
+    backfill.add_argument('--no-store', dest='no_backfill_store', action='store_true',
+                          help="do not add the archived entries to an article store")
+    _add_output_options(backfill)
+
+    query = commands.add_parser('query', help="match keywords or contacts against every stored article")
+    query.add_argument('--keyword', action='append', dest='query_keywords', metavar='PHRASE',
+                       help="keyword to look for, repeatable (default: the monitored keywords)")
+    query.add_argument('--name', action='append', dest='query_names', metavar='NAME',
+                       help="only keep hits mentioning this contact, repeatable")
+    query.add_argument('--days-back', type=int, help="only articles from the last N days (default: all)")
+    query.add_argument('--db', default='media_articles.db', metavar='PATH',
+                       help="article store path (default: %(default)s)")
+    _add_output_options(query)
+
+    commands.add_parser('sources', help="list the configured media sources")
+    commands.add_parser('keywords', help="list the monitored keywords")
+    commands.add_parser('interactive', help="prompt for the contacts file and search window")
+    return parser
+
+
+def _cli_searcher(parser, args):
+    """Searcher configured from the parsed options (validates --sources/--outputs/--web-search)"""
+    outputs = getattr(args, 'outputs', None)
+    if outputs is not None:
+        if outputs == ['none']:
+            args.outputs = []
+        elif set(outputs) - set(OUTPUT_CHOICES):
+            parser.error(f"--outputs: unknown output(s) {', '.join(sorted(set(outputs) - set(OUTPUT_CHOICES)))}")
+
+    windows = getattr(args, 'dashboard_windows', None)
+    if windows is not None:
+        try:
+            args.dashboard_windows = {spec: _window_seconds(spec) for spec in windows}
+        except ValueError as e:
+            parser.error(f"--dashboard-windows: {e}")
+
+    searcher = MediaStoryKeywordSearcher()
+    if getattr(args, 'sources', None):
+        unknown = [name for name in args.sources if name not in searcher.media_sources]
+        if unknown:
+            parser.error(f"--sources: unknown source(s) {', '.join(unknown)}")
+
+    if hasattr(args, 'no_store'):
+        if not args.no_cache:
+            searcher.enable_feed_cache()
+        if not args.no_store:
+            searcher.enable_article_store(args.db)
+        if args.full_text:
+            searcher.enable_full_text(filter=args.full_text)
+    if args.stream:
+        searcher.enable_result_stream(args.stream_dir, args.stream)
+    if getattr(args, 'web_search', None):
+        if args.web_search == 'stub':
+            provider = StubSearchProvider.from_jsonl(args.stub_corpus or os.devnull)
+        else:
+            try:
+                provider = SEARCH_PROVIDERS[args.web_search](user_agent=searcher.user_agent)
+            except ValueError as e:
+                parser.error(f"--web-search {args.web_search}: {e}")
+        searcher.enable_web_search(provider, args.search_cache, max_pages=args.search_pages)
+    return searcher
+
+
+def _cli_output_paths(args):
+    """MediaWatchService output arguments for the selected outputs"""
+    return {
+        'report_path': args.report if 'report' in args.outputs else None,
+        'export_prefix': args.export_prefix if 'export' in args.outputs else None,
+        'dashboard_path': args.dashboard if 'dashboard' in args.outputs else None,
+        'metrics_path': args.metrics or None,
+        'xlsx_max_rows': args.xlsx_max_rows,
+        'dashboard_windows': args.dashboard_windows
+    }
+
+
+def _run_interactive():
+    """The original prompt-driven run"""
     print("=== Media Story Keyword Search & Analysis System ===")
     print("Searching for sensitive content across media outlets\n")
-    
+
     # Create searcher
     searcher = MediaStoryKeywordSearcher()
-    
+    searcher.enable_feed_cache()
+    searcher.enable_article_store()
+
     print(f"Monitoring {len(searcher.keywords)} keywords for sensitive content")
-    
+
     # Load contacts from Salesforce
     load_contacts = input("\nLoad Salesforce contacts database? (y/n) [y]: ").strip().lower()
     if load_contacts != 'n':
         contacts_path = input("Enter path to Salesforce Contracts.xlsx [Salesforce Contracts.xlsx]: ").strip()
         if not contacts_path:
             contacts_path = "Salesforce Contracts.xlsx"
-        
+
         if not searcher.load_contacts(contacts_path):
             print("⚠️  Continuing without contacts database...")
-    
+
     # Search time range
     days_input = input("\nSearch articles from last N days [7]: ").strip()
     days_back = int(days_input) if days_input else 7
-    
+
     # Perform searches
     print("\n📡 Starting media search...")
-    
+
     # Search RSS feeds
     searcher.search_rss_feeds(days_back=days_back)
-    
-    # Note about web search
-    print("\n⚠️  Web search simulation skipped. Implement actual API integrations for production use.")
-    
+
+    # Search news APIs when a key is configured
+    if os.environ.get('NEWSAPI_KEY'):
+        searcher.enable_web_search(NewsAPIProvider(user_agent=searcher.user_agent))
+    searcher.search_web(days_back=days_back)
+
     # Generate reports
     print("\n📊 Generating analysis reports...")
     searcher.generate_keyword_report()
     searcher.export_search_results()
     searcher.create_keyword_dashboard_data()
-    
+    searcher.metrics.write('arc_metrics')
+
     print("\n✅ Analysis complete!")
     print("Generated files:")
     print("- media_keyword_analysis.md - Comprehensive keyword analysis")
     print("- media_search_results.csv/xlsx - All search results data")
     print("- keyword_dashboard_data.json - Data for visualization dashboard")
+    print("- arc_metrics.json/prom - Stage timings and counters")
+    return 0
+
+
+def main(argv=None):
+    """Entry point; returns the process exit code"""
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+
+    if args.command in (None, 'interactive'):
+        return _run_interactive()
+
+    if args.command == 'sources':
+        for name, info in MediaStoryKeywordSearcher().media_sources.items():
+            print(f"{name}\t{info['rss']}")
+        return 0
+
+    if args.command == 'keywords':
+        print('\n'.join(MediaStoryKeywordSearcher().keywords))
+        return 0
+
+    searcher = _cli_searcher(parser, args)
+    paths = _cli_output_paths(args)
+
+    if args.command == 'watch':
+        if args.no_store:
+            parser.error("watch: --no-store is not supported; the article store tracks hits between polls")
+        scheduler = AdaptivePollScheduler(args.sources or searcher.media_sources,
+                                          initial_interval=args.min_interval,
+                                          min_interval=args.min_interval, max_interval=args.max_interval)
+        # The service loads (and later reloads) the contacts workbook itself
+        service = MediaWatchService(searcher, days_back=args.days_back, scheduler=scheduler,
+                                    contacts_path=args.contacts, **paths)
+        service.run()
+        return 0
+
+    if args.contacts and not searcher.load_contacts(args.contacts):
+        print("⚠️  Continuing without contacts database...")
+
+    if args.command == 'backfill':
+        if not args.no_backfill_store:
+            searcher.enable_article_store(args.db)
+        searcher.backfill_archives(args.paths, processes=args.processes, since=args.since, until=args.until)
+    elif args.command == 'query':
+        searcher.enable_article_store(args.db)
+        searcher.query_history(args.query_keywords, args.query_names, args.days_back)
+    else:
+        searcher.search_rss_feeds(days_back=args.days_back, sources=args.sources)
+        if searcher.web_search is not None:
+            searcher.search_web(days_back=args.days_back)
+
+    MediaWatchService(searcher, **paths).write_outputs()
+    if paths['metrics_path']:
+        searcher.metrics.write(paths['metrics_path'])
+
+    # Non-zero exit when every polled source failed, so cron/health checks notice
+    if args.command == 'search':
+        statuses = [searcher.source_status.get(name, {}) for name in (args.sources or searcher.media_sources)]
+        if statuses and all(status.get('error') for status in statuses):
+            return 1
+    return 0
+
+
+# Main execution
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,291 @@
+"""Offline benchmarks for ARC_new.MediaStoryKeywordSearcher.
+
+Generates synthetic RSS/Atom feeds and Salesforce-shaped contact workbooks,
+serves the feeds from a local stub HTTP server, and reports throughput and
+peak memory for each stage. No network access is needed.
+
+    python benchmark_arc.py --articles 100000 --contacts 20000
+    python benchmark_arc.py --save baseline.json
+    python benchmark_arc.py --compare baseline.json --tolerance 0.25
+"""
+import argparse
+import email.utils
+import http.server
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from xml.sax.saxutils import escape
+
+import pandas as pd
+
+from ARC_new import MediaStoryKeywordSearcher, ResultStream, _utc_now
+
+FIRST_NAMES = ["James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda",
+               "David", "Elizabeth", "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica"]
+LAST_NAMES = ["Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis",
+              "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas"]
+FILLER_WORDS = ("the a of to and in on for with said report new state city officials week "
+                "year people university policy court school public economy election board "
+                "program research study council budget plan market health water energy").split()
+
+
+def make_contacts(n, seed=0):
+    """Synthetic contact names; surnames carry a numeric suffix so they stay distinct"""
+    rng = random.Random(seed)
+    return [(rng.choice(FIRST_NAMES), f"{rng.choice(LAST_NAMES)}{i}") for i in range(n)]
+
+
+def write_contacts_workbook(path, contacts):
+    """Write contacts in the Salesforce export layout load_contacts expects"""
+    header = ['', 'Salutation', '', 'First Name', 'Last Name', 'Title', 'Account Name',
+              'Mailing Street', 'Mailing City', 'Mailing State/Province', 'Mailing Zip/Postal Code',
+              'Mailing Country', 'Phone', 'Fax', 'Mobile', 'Email', 'Account Owner']
+    rows = [[''] * len(header) for _ in range(10)]  # Report banner rows skipped by load_contacts
+    rows.append(header)
+    for i, (first, last) in enumerate(contacts):
+        rows.append(['', 'Dr.', '', first, last, 'Professor', f'University {i % 500}',
+                     f'{i} Main St', 'Springfield', 'VA', f'{20000 + i % 9999:05d}', 'USA',
+                     f'555-{i % 10000:04d}', '', '', f'{first.lower()}.{last.lower()}@example.edu',
+                     'Owner'])
+    pd.DataFrame(rows).to_excel(path, header=False, index=False)
+
+
+def iter_entries(n, keywords, contacts, hit_rate=0.2, contact_rate=0.05, seed=1):
+    """Yield synthetic normalized feed entries with a controlled share of hits"""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    for i in range(n):
+        words = rng.choices(FILLER_WORDS, k=40)
+        if rng.random() < hit_rate:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords))
+        if contacts and rng.random() < contact_rate:
+            words.insert(rng.randrange(len(words)), ' '.join(rng.choice(contacts)))
+        published = now - timedelta(minutes=i % 1440)
+        yield {
+            'id': f'urn:bench:{i}',
+            'title': ' '.join(words[:10]).capitalize(),
+            'link': f'https://news.example.com/story/{i}',
+            'published': email.utils.format_datetime(published),
+            'published_parsed': list(published.timetuple()),
+            'summary': ' '.join(words[10:])
+        }
+
+
+def render_rss(entries, title='Bench feed'):
+    """RSS 2.0 document for a list of entries"""
+    items = ''.join(
+        f"<item><title>{escape(e['title'])}</title><link>{escape(e['link'])}</link>"
+        f"<guid>{escape(e['id'])}</guid><pubDate>{e['published']}</pubDate>"
+        f"<description>{escape(e['summary'])}</description></item>"
+        for e in entries
+    )
+    return (f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>{escape(title)}</title>{items}</channel></rss>').encode('utf-8')
+
+
+def render_atom(entries, title='Bench feed'):
+    """Atom 1.0 document for a list of entries"""
+    items = ''.join(
+        f"<entry><title>{escape(e['title'])}</title><link href=\"{escape(e['link'])}\"/>"
+        f"<id>{escape(e['id'])}</id>"
+        f"<published>{datetime(*e['published_parsed'][:6]).isoformat()}Z</published>"
+        f"<summary>{escape(e['summary'])}</summary></entry>"
+        for e in entries
+    )
+    return (f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>{escape(title)}</title>{items}</feed>').encode('utf-8')
+
+
+def write_feed_files(directory, entries, feeds):
+    """Split entries across feed files (alternating RSS and Atom); returns their names"""
+    names = []
+    per_feed = max(1, -(-len(entries) // feeds))
+    for f in range(feeds):
+        chunk = entries[f * per_feed:(f + 1) * per_feed]
+        render = render_rss if f % 2 == 0 else render_atom
+        name = f'feed{f}.xml'
+        with open(os.path.join(directory, name), 'wb') as fh:
+            fh.write(render(chunk, title=f'Bench feed {f}'))
+        names.append(name)
+    return names
+
+
+class StubFeedServer:
+    """Serve a directory of feed files over HTTP on localhost"""
+
+    def __init__(self, directory):
+        handler = lambda *args, **kwargs: _QuietHandler(*args, directory=directory, **kwargs)
+        self.httpd = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.base_url = f'http://127.0.0.1:{self.httpd.server_address[1]}'
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+class StageTimer:
+    """Measure wall time and peak traced memory of benchmark stages"""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.results = []
+
+    def run(self, stage, items, func, *args, **kwargs):
+        """Run one stage, print and record its numbers, and return its value"""
+        if self.trace_memory:
+            tracemalloc.start()
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        value = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] if self.trace_memory else None
+        if self.trace_memory:
+            tracemalloc.stop()
+
+        result = {
+            'stage': stage,
+            'items': items,
+            'seconds': round(elapsed, 4),
+            'items_per_sec': round(items / elapsed, 1) if elapsed > 0 else None,
+            'peak_mb': round(peak / 1024 / 1024, 2) if peak is not None else None
+        }
+        self.results.append(result)
+        memory = f"{result['peak_mb']:>9.1f} MB" if peak is not None else ''
+        print(f"  {stage:<24} {items:>9} items  {elapsed:>8.3f} s  "
+              f"{result['items_per_sec'] or 0:>12,.0f}/s {memory}")
+        return value
+
+
+def _quiet(func, *args, **kwargs):
+    """Call func with its progress prints suppressed"""
+    with open(os.devnull, 'w') as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            return func(*args, **kwargs)
+        finally:
+            sys.stdout = stdout
+
+
+def _stream_results(stream, results):
+    """Append results to a ResultStream the way the searcher does"""
+    for result in results:
+        stream.write(result)
+    return stream.flush()
+
+
+def run_benchmarks(args):
+    """Run every stage at the requested sizes; returns the stage results"""
+    timer = StageTimer(trace_memory=not args.no_memory)
+    workdir = tempfile.mkdtemp(prefix='arc_bench_')
+    try:
+        searcher = MediaStoryKeywordSearcher()
+        contacts = make_contacts(args.contacts)
+        # Entries are generated lazily so 1M-article runs keep a flat memory profile
+        entries = lambda n: iter_entries(n, searcher.keywords, contacts, hit_rate=args.hit_rate)
+        print(f"\n📏 {args.articles} articles, {args.contacts} contacts, {args.feeds} feeds\n")
+
+        # Contacts: cold Excel parse, then the cached snapshot
+        workbook = os.path.join(workdir, 'contacts.xlsx')
+        write_contacts_workbook(workbook, contacts)
+        snapshot_dir = os.path.join(workdir, 'snapshot')
+        timer.run('load_contacts (excel)', args.contacts, _quiet, searcher.load_contacts, workbook, snapshot_dir)
+        timer.run('load_contacts (snapshot)', args.contacts, _quiet, searcher.load_contacts, workbook, snapshot_dir)
+
+        # Matching hot path, without network or XML parsing
+        cutoff = _utc_now() - timedelta(days=7)
+        searcher._reset_results()
+        results, _ = timer.run('match entries', args.articles, searcher._process_entries, 'Bench',
+                               entries(args.articles), cutoff)
+
+        # Output writers over the matched results
+        timer.run('generate_keyword_report', len(results), _quiet, searcher.generate_keyword_report,
+                  os.path.join(workdir, 'report.md'))
+        timer.run('create_dashboard_data', len(results), _quiet, searcher.create_keyword_dashboard_data,
+                  os.path.join(workdir, 'dashboard.json'))
+        if len(results) <= args.max_export:
+            timer.run('export_search_results', len(results), _quiet, searcher.export_search_results,
+                      os.path.join(workdir, 'results'))
+        timer.run('stream results (jsonl)', len(results), _stream_results,
+                  ResultStream(os.path.join(workdir, 'stream')), results)
+
+        # End to end over the stub HTTP server (fetch + parse + match)
+        feed_entries = list(entries(args.feed_articles))
+        feed_dir = os.path.join(workdir, 'feeds')
+        os.makedirs(feed_dir)
+        names = write_feed_files(feed_dir, feed_entries, args.feeds)
+        with StubFeedServer(feed_dir) as server:
+            searcher.media_sources = {
+                f'Feed {i}': {'rss': f'{server.base_url}/{name}', 'name': f'Feed {i}'}
+                for i, name in enumerate(names)
+            }
+            timer.run('search_rss_feeds (http)', len(feed_entries), _quiet, searcher.search_rss_feeds, 7)
+
+        return timer.results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare_results(results, baseline_path, tolerance):
+    """Print stages whose throughput fell more than tolerance below the baseline"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = {r['stage']: r for r in json.load(f)['results']}
+
+    regressions = []
+    for result in results:
+        base = baseline.get(result['stage'])
+        if not base or not base['items_per_sec'] or not result['items_per_sec']:
+            continue
+        ratio = result['items_per_sec'] / base['items_per_sec']
+        if ratio < 1 - tolerance:
+            regressions.append(result['stage'])
+            print(f"❌ {result['stage']}: {ratio:.0%} of baseline throughput")
+    if not regressions:
+        print(f"✓ No stage slower than {tolerance:.0%} below {baseline_path}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the media keyword searcher")
+    parser.add_argument('--articles', type=int, default=10000, help="synthetic articles to match (1k-1M)")
+    parser.add_argument('--contacts', type=int, default=5000, help="synthetic contacts (1k-100k)")
+    parser.add_argument('--feeds', type=int, default=10, help="feeds served by the stub HTTP server")
+    parser.add_argument('--feed-articles', type=int, default=2000, help="articles spread across served feeds")
+    parser.add_argument('--hit-rate', type=float, default=0.2, help="share of articles containing a keyword")
+    parser.add_argument('--max-export', type=int, default=200000, help="skip the CSV/XLSX export above this")
+    parser.add_argument('--no-memory', action='store_true', help="skip tracemalloc (faster, no peak memory)")
+    parser.add_argument('--save', help="write results to this JSON file")
+    parser.add_argument('--compare', help="baseline JSON to check for throughput regressions")
+    parser.add_argument('--tolerance', type=float, default=0.25, help="allowed throughput drop vs baseline")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump({'generated': datetime.now().isoformat(), 'args': vars(args), 'results': results}, f, indent=2)
+        print(f"\n✓ Benchmark results saved to {args.save}")
+
+    if args.compare and compare_results(results, args.compare, args.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
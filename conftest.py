@@ -0,0 +1,20 @@
+"""Shared fixtures for the ARC_new tests: local stub feeds and synthetic data (no network)
+
+    python -m pytest -q
+"""
+import pytest
+
+from ARC_new import MediaStoryKeywordSearcher
+from benchmark_arc import StubFeedServer, iter_entries, write_feed_files
+
+
+@pytest.fixture
+def stub_feeds(tmp_path):
+    """media_sources for two stub feeds (RSS and Atom) of recent entries, about half of them hits"""
+    searcher = MediaStoryKeywordSearcher()
+    entries = list(iter_entries(200, searcher.keywords, [('William', 'Smith')], hit_rate=0.5, contact_rate=0.2))
+    feed_dir = tmp_path / 'feeds'
+    feed_dir.mkdir()
+    names = write_feed_files(str(feed_dir), entries, 2)
+    with StubFeedServer(str(feed_dir)) as server:
+        yield {f'Feed {i}': {'rss': f'{server.base_url}/{name}', 'name': f'Feed {i}'} for i, name in enumerate(names)}
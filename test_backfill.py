@@ -0,0 +1,70 @@
+"""Archive replay and multi-process backfill"""
+import json
+from datetime import datetime
+
+from ARC_new import MediaStoryKeywordSearcher
+from benchmark_arc import iter_entries
+
+
+def _write_dump(path, entries):
+    with open(path, 'w', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps({key: entry[key] for key in ('id', 'title', 'link', 'published', 'summary')}) + '\n')
+
+
+def test_backfill_is_identical_across_process_counts(tmp_path):
+    keywords = MediaStoryKeywordSearcher().keywords
+    _write_dump(tmp_path / 'dump.jsonl', iter_entries(600, keywords, [], hit_rate=0.4))
+    # Same URLs again, so cross-shard deduplication is exercised
+    _write_dump(tmp_path / 'dupes.jsonl', iter_entries(100, keywords, [], hit_rate=1.0))
+
+    results = []
+    for processes in (1, 3):
+        searcher = MediaStoryKeywordSearcher()
+        searcher.backfill_archives(str(tmp_path), processes=processes, shard_bytes=4096)
+        results.append([record.to_dict() for record in searcher.articles])
+
+    assert results[0] and results[0] == results[1]
+    assert len({result['url'] for result in results[0]}) == len(results[0])
+
+
+def test_backfill_date_filters_use_published_strings(tmp_path):
+    with open(tmp_path / 'dump.jsonl', 'w', encoding='utf-8') as f:
+        for year in (2019, 2021, 2023):
+            f.write(json.dumps({'title': f'Sexual harassment claims in {year}', 'link': f'https://x.test/{year}',
+                                'published': f'Mon, 01 Jul {year} 12:00:00 +0000'}) + '\n')
+
+    searcher = MediaStoryKeywordSearcher()
+    searcher.backfill_archives(str(tmp_path), processes=1, since=datetime(2020, 1, 1), until=datetime(2022, 1, 1))
+    assert [record.url for record in searcher.articles] == ['https://x.test/2021']
+
+
+def test_backfill_accepts_timezone_aware_bounds(tmp_path):
+    with open(tmp_path / 'dump.jsonl', 'w', encoding='utf-8') as f:
+        for hour in (9, 11, 13):
+            f.write(json.dumps({'title': 'Sexual harassment claims', 'link': f'https://x.test/{hour}',
+                                'published': f'Mon, 01 Jul 2024 {hour}:00:00 +0000'}) + '\n')
+
+    # 12:00+02:00 is 10:00 UTC and 15:00+02:00 is 13:00 UTC
+    searcher = MediaStoryKeywordSearcher()
+    searcher.backfill_archives(str(tmp_path), processes=1,
+                               since=datetime.fromisoformat('2024-07-01T12:00:00+02:00'),
+                               until=datetime.fromisoformat('2024-07-01T15:00:00+02:00'))
+    assert [record.url for record in searcher.articles] == ['https://x.test/11']
+
+
+def test_backfill_adds_every_entry_to_the_article_store(tmp_path):
+    keywords = MediaStoryKeywordSearcher().keywords
+    archive_dir = tmp_path / 'archive'
+    archive_dir.mkdir()
+    _write_dump(archive_dir / 'dump.jsonl', iter_entries(300, keywords, [('William', 'Smith')],
+                                                         hit_rate=0.4, contact_rate=0.3))
+
+    searcher = MediaStoryKeywordSearcher()
+    store = searcher.enable_article_store(str(tmp_path / 'articles.db'))
+    searcher.backfill_archives(str(archive_dir), processes=3, shard_bytes=4096)
+    backfilled = sorted((record.url, tuple(record.keywords_found)) for record in searcher.articles)
+
+    assert store.conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0] == 300
+    assert searcher.query_history() == len(backfilled)
+    assert sorted((record.url, tuple(record.keywords_found)) for record in searcher.articles) == backfilled
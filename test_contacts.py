@@ -0,0 +1,42 @@
+"""Loading the Salesforce contacts workbook and its snapshot"""
+import json
+from datetime import datetime
+
+import ARC_new
+from ARC_new import MediaStoryKeywordSearcher
+from benchmark_arc import make_contacts, write_contacts_workbook
+
+
+def test_contacts_snapshot_from_another_version_is_rebuilt(tmp_path):
+    workbook = str(tmp_path / 'contacts.xlsx')
+    write_contacts_workbook(workbook, make_contacts(20))
+    snapshot_dir = tmp_path / 'snapshot'
+    searcher = MediaStoryKeywordSearcher()
+    assert searcher.load_contacts(workbook, str(snapshot_dir))
+
+    meta_path, = snapshot_dir.glob('*.meta.json')
+    meta = json.loads(meta_path.read_text())
+    assert meta['version'] == ARC_new.CONTACTS_SNAPSHOT_VERSION
+    meta['version'] = ARC_new.CONTACTS_SNAPSHOT_VERSION - 1
+    meta['created'] = 'stale'
+    meta_path.write_text(json.dumps(meta))
+
+    assert searcher.load_contacts(workbook, str(snapshot_dir))
+    meta = json.loads(meta_path.read_text())
+    assert meta['version'] == ARC_new.CONTACTS_SNAPSHOT_VERSION and meta['created'] != 'stale'
+
+
+def test_contacts_past_the_first_thousand_are_matched(tmp_path):
+    contacts = make_contacts(1500)
+    workbook = str(tmp_path / 'contacts.xlsx')
+    write_contacts_workbook(workbook, contacts)
+    searcher = MediaStoryKeywordSearcher()
+    assert searcher.load_contacts(workbook, str(tmp_path / 'snapshot'))
+    assert len(searcher.contact_names) == 1500
+
+    first, last = contacts[1400]
+    entries = [{'id': '1', 'title': f'{first} {last} accused of plagiarism', 'link': 'https://x.test/1',
+                'summary': ''}]
+    searcher._process_entries('Test', entries, datetime.min)
+    assert list(searcher.contact_mentions) == [searcher.contact_names[1400]]
+    assert searcher.mentions_of(searcher.contact_names[1400])[0]['url'] == 'https://x.test/1'
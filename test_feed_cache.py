@@ -0,0 +1,20 @@
+"""Conditional GETs against the on-disk feed cache"""
+from ARC_new import MediaStoryKeywordSearcher
+
+
+def test_conditional_get_reuses_cached_feed(stub_feeds, tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.media_sources = stub_feeds
+    searcher.enable_feed_cache(str(tmp_path / 'feed_cache'))
+
+    first = searcher.fetch_feeds()
+    second = searcher.fetch_feeds()
+
+    assert second == first
+    assert all(isinstance(entries, list) and entries for entries in first.values())
+    statuses = {}
+    for (name, labels), value in searcher.metrics.counters.items():
+        if name == 'http_responses':
+            status = dict(labels)['status']
+            statuses[status] = statuses.get(status, 0) + value
+    assert statuses == {'200': len(stub_feeds), '304': len(stub_feeds)}
@@ -0,0 +1,25 @@
+"""Full article body retrieval"""
+from ARC_new import MediaStoryKeywordSearcher
+from benchmark_arc import StubFeedServer, iter_entries, write_feed_files
+
+
+def test_failed_body_fetches_are_retried(tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    entries = list(iter_entries(20, searcher.keywords, [], hit_rate=1.0))
+    with StubFeedServer(str(tmp_path)) as server:
+        for i, entry in enumerate(entries):
+            entry['link'] = f'{server.base_url}/story{i}.html'
+        names = write_feed_files(str(tmp_path), entries, 2)
+        searcher.media_sources = {name: {'rss': f'{server.base_url}/{name}', 'name': name} for name in names}
+        searcher.enable_article_store(str(tmp_path / 'articles.db'))
+        searcher.enable_full_text(str(tmp_path / 'text.db'), per_host_interval=0)
+
+        # Every story 404s, so the hits are held back for the next poll
+        assert searcher.search_rss_feeds(days_back=7) == 0
+        assert searcher.article_store.seen_keys(
+            searcher.article_store.article_key(e['link'], e['id']) for e in entries) == set()
+
+        for i in range(len(entries)):
+            (tmp_path / f'story{i}.html').write_text('<html><p>Story text</p></html>')
+        assert searcher.search_rss_feeds(days_back=7) == len(entries)
+        assert searcher.search_rss_feeds(days_back=7) == 0
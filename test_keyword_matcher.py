@@ -0,0 +1,35 @@
+"""Single-pass keyword matching"""
+from ARC_new import MediaStoryKeywordSearcher, PhraseMatcher, tokenize
+
+
+def test_keywords_match_whole_words_only():
+    searcher = MediaStoryKeywordSearcher()
+    searcher.keywords = ['Die', 'Oxy', 'Sexual harassment']
+    searcher._compile_keyword_matcher()
+
+    assert searcher.match_keywords(tokenize("A new diet of oxygen bars")) == []
+    assert searcher.match_keywords(tokenize("Patients die after Oxy overdose")) == ['Die', 'Oxy']
+    assert searcher.match_keywords(tokenize("Sexual-harassment claims")) == ['Sexual harassment']
+    assert searcher.match_keywords(tokenize("sexual and harassment")) == []
+
+
+def test_keyword_list_is_deduplicated():
+    searcher = MediaStoryKeywordSearcher()
+    assert len(searcher.keywords) == len({keyword.lower() for keyword in searcher.keywords})
+    assert searcher.keywords.count('Allegation') == 1
+
+    searcher.keywords = ['Alleged', 'alleged', 'Accused', 'Alleged']
+    searcher._compile_keyword_matcher()
+    assert searcher.keywords == ['Alleged', 'Accused']
+    assert searcher.match_keywords(tokenize("Alleged, alleged and accused")) == ['Alleged', 'Accused']
+
+
+def test_phrase_matcher_finds_overlapping_phrases():
+    matcher = PhraseMatcher()
+    for value, phrase in enumerate(['white supremacy', 'white supremacist', 'white']):
+        matcher.add(phrase, value)
+    assert matcher.add('--', 3) is False
+
+    assert matcher.find(tokenize("A white supremacist group")) == {1, 2}
+    assert sorted((start, size) for start, size, _ in matcher.iter_matches(tokenize("white supremacy, white"))) == \
+        [(0, 1), (0, 2), (2, 1)]
@@ -0,0 +1,56 @@
+"""Metrics snapshots in JSON and the Prometheus text format"""
+import json
+from pathlib import Path
+
+from ARC_new import Metrics, MediaStoryKeywordSearcher
+
+
+def _metrics():
+    metrics = Metrics()
+    metrics.incr('keyword_hits', 2, source='CNN')
+    metrics.incr('keyword_hits', source='CNN')
+    metrics.incr('keyword_hits', source='Fox "News"')
+    metrics.set_gauge('results_in_window', 7)
+    metrics.observe('fetch', 0.5, source='CNN')
+    metrics.observe('fetch', 1.5, source='CNN')
+    return metrics
+
+
+def test_snapshot_is_json_ready():
+    snapshot = json.loads(json.dumps(_metrics().snapshot()))
+    assert {'name': 'keyword_hits', 'labels': {'source': 'CNN'}, 'value': 3} in snapshot['counters']
+    assert snapshot['gauges'] == [{'name': 'results_in_window', 'labels': {}, 'value': 7}]
+    timing, = snapshot['timings']
+    assert timing == {'name': 'fetch', 'labels': {'source': 'CNN'},
+                      'count': 2, 'total': 2.0, 'max': 1.5, 'last': 1.5}
+
+
+def test_prometheus_text_format():
+    lines = _metrics().to_prometheus().splitlines()
+    assert lines == [
+        '# TYPE arc_keyword_hits_total counter',
+        'arc_keyword_hits_total{source="CNN"} 3',
+        'arc_keyword_hits_total{source="Fox \\"News\\""} 1',
+        '# TYPE arc_results_in_window gauge',
+        'arc_results_in_window 7',
+        '# TYPE arc_fetch_seconds summary',
+        'arc_fetch_seconds_count{source="CNN"} 2',
+        'arc_fetch_seconds_sum{source="CNN"} 2.000000',
+        '# TYPE arc_fetch_seconds_max gauge',
+        'arc_fetch_seconds_max{source="CNN"} 1.500000',
+    ]
+
+
+def test_search_records_per_source_metrics(stub_feeds, tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.media_sources = stub_feeds
+    searcher.search_rss_feeds(days_back=7)
+    json_path, prom_path = searcher.metrics.write(str(tmp_path / 'metrics'))
+
+    counters = {(c['name'], c['labels'].get('source')): c['value']
+                for c in json.loads(Path(json_path).read_text())['counters']}
+    assert counters[('entries_scanned', 'Feed 0')] + counters[('entries_scanned', 'Feed 1')] == 200
+    assert sum(counters[('keyword_hits', source)] for source in stub_feeds) == searcher.aggregates.total_articles
+    prometheus = Path(prom_path).read_text()
+    assert 'arc_entries_scanned_total{source="Feed 0"}' in prometheus
+    assert 'arc_keyword_match_seconds_count{source="Feed 1"} 1' in prometheus
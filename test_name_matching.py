@@ -0,0 +1,71 @@
+"""Contact name variants: nicknames, typos, initials and middle names"""
+import pytest
+
+from ARC_new import ContactNameIndex, capitalized_positions, tokenize
+
+
+def _name_index(*names):
+    index = ContactNameIndex()
+    for contact_id, (first, last) in enumerate(names):
+        index.add(contact_id, tuple(tokenize(f'{first} {last}')), tuple(tokenize(first)), tuple(tokenize(last)))
+    return index
+
+
+def _find(index, text):
+    return index.find(tokenize(text), capitalized_positions(text))
+
+
+@pytest.mark.parametrize('text', [
+    "William Smith said",
+    "Bill Smith said",
+    "W. Smith said",
+    "William J. Smith said",
+    "W Smith said",
+    "Wiliam Smith said",
+    "Smith's lawyer, William Smith, said",
+])
+def test_name_variants_match(text):
+    assert _find(_name_index(('William', 'Smith')), text) == {0}
+
+
+@pytest.mark.parametrize('text', [
+    "Officials will Smith the budget",
+    "John Smith said",
+    "William Smithson said",
+    "Smith said",
+    "w smith said",
+    "the Senate bill, Smith said",
+    "Officials will sue Smith",
+])
+def test_name_variants_reject(text):
+    assert _find(_name_index(('William', 'Smith')), text) == set()
+
+
+@pytest.mark.parametrize('name, text', [
+    (('Francis', 'Jones'), "a frank Jones interview"),
+    (('Richard', 'Brown'), "The rich Brown family"),
+    (('Eugene', 'Davis'), "the gene Davis studied"),
+    (('Elizabeth', 'Warren'), "a beth Warren"),
+])
+def test_lowercase_words_are_not_nicknames(name, text):
+    assert _find(_name_index(name), text) == set()
+    assert _find(_name_index(name), text.replace(text.split()[1], text.split()[1].title())) == {0}
+
+
+@pytest.mark.parametrize('name, text', [
+    (('Andrew', 'White'), "Marchers at a white supremacist rally"),
+    (('Andrew', 'White'), "Marchers at A White supremacist rally"),
+    (('Alice', 'Price'), "Officials will pay a price"),
+    (('Alice', 'Price'), "A. Price hike"),
+    (('Ian', 'Price'), "The price I paid"),
+    (('Ian', 'Price'), "I Price everything"),
+])
+def test_stopwords_are_not_initials(name, text):
+    assert _find(_name_index(name), text) == set()
+
+
+def test_ambiguous_initial_is_rejected():
+    index = _name_index(('William', 'Smith'), ('Walter', 'Smith'))
+    assert _find(index, "W. Smith said") == set()
+    assert _find(index, "Walt Smith said") == {1}
+    assert _find(index, "Walter Smith said") == {1}
@@ -0,0 +1,32 @@
+"""Retroactive keyword and contact queries over the article store"""
+from datetime import datetime
+
+from ARC_new import MediaStoryKeywordSearcher
+
+
+def _hits(searcher):
+    return sorted((r.source, r.title, r.url, tuple(r.keywords_found), tuple(r.contacts_mentioned))
+                  for r in searcher.articles)
+
+
+def test_query_history_matches_live_search(stub_feeds, tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.media_sources = stub_feeds
+    searcher.enable_article_store(str(tmp_path / 'articles.db'))
+    searcher.search_rss_feeds(days_back=7)
+    live = _hits(searcher)
+
+    assert searcher.query_history(days_back=7) == len(live)
+    assert _hits(searcher) == live
+    assert live
+
+
+def test_query_history_keeps_name_capitalization(tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.enable_article_store(str(tmp_path / 'articles.db'))
+    entries = [{'id': str(i), 'title': title, 'link': f'https://x.test/{i}', 'summary': 'Sexual harassment claims'}
+               for i, title in enumerate(["Bill Smith said", "The Senate bill, Smith said", "W. Smith said"])]
+    searcher._process_entries('Test', entries, datetime.min)
+
+    assert searcher.query_history(contacts=['William Smith']) == 2
+    assert sorted(record.title for record in searcher.articles) == ["Bill Smith said", "W. Smith said"]
@@ -0,0 +1,56 @@
+"""Append-only JSONL/Parquet export partitioned by publish date and source"""
+import json
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from ARC_new import MediaStoryKeywordSearcher
+
+
+def _add_hits(searcher, *hits):
+    for url, source, published_at in hits:
+        searcher._add_result(source, 'Professor accused', url, 'Unknown', '...', ['Accused'], [], published_at)
+
+
+def _jsonl_urls(path):
+    return [json.loads(line)['url'] for line in path.read_text(encoding='utf-8').splitlines()]
+
+
+def test_jsonl_partitions_by_day_and_source_and_appends(tmp_path):
+    root = tmp_path / 'stream'
+    july_1 = datetime(2024, 7, 1, 23, 30, tzinfo=timezone.utc)
+    july_2 = datetime(2024, 7, 2, 0, 30, tzinfo=timezone.utc)
+
+    searcher = MediaStoryKeywordSearcher()
+    searcher.enable_result_stream(str(root), 'jsonl', batch_size=2)
+    _add_hits(searcher, ('https://x.test/1', 'CNN', july_1), ('https://x.test/2', 'Fox News', july_2),
+              ('https://x.test/3', 'CNN', None))
+    assert searcher.flush_result_stream() == 1
+
+    # A later run appends to the same partition files
+    searcher = MediaStoryKeywordSearcher()
+    searcher.enable_result_stream(str(root), 'jsonl')
+    _add_hits(searcher, ('https://x.test/4', 'CNN', july_1))
+    searcher.flush_result_stream()
+
+    files = sorted(str(path.relative_to(root)) for path in root.rglob('*') if path.is_file())
+    assert files == ['2024-07-01/CNN/results.jsonl', '2024-07-02/Fox_News/results.jsonl',
+                     'unknown/CNN/results.jsonl']
+    assert _jsonl_urls(root / '2024-07-01' / 'CNN' / 'results.jsonl') == ['https://x.test/1', 'https://x.test/4']
+    row = json.loads((root / '2024-07-02' / 'Fox_News' / 'results.jsonl').read_text(encoding='utf-8'))
+    assert row['source'] == 'Fox News' and row['published_at'] == '2024-07-02T00:30:00+00:00'
+    assert row['keywords_found'] == ['Accused']
+
+
+def test_parquet_adds_a_part_file_per_flush(tmp_path):
+    root = tmp_path / 'stream'
+    published_at = datetime(2024, 7, 1, 12, tzinfo=timezone.utc)
+    searcher = MediaStoryKeywordSearcher()
+    searcher.enable_result_stream(str(root), 'parquet')
+    for url in ('https://x.test/1', 'https://x.test/2'):
+        _add_hits(searcher, (url, 'CNN', published_at))
+        searcher.flush_result_stream()
+
+    parts = sorted((root / '2024-07-01' / 'CNN').glob('part-*.parquet'))
+    assert len(parts) == 2
+    assert list(pd.concat(pd.read_parquet(part) for part in parts)['url']) == ['https://x.test/1', 'https://x.test/2']
@@ -0,0 +1,64 @@
+"""Compact result records and the writers reading them"""
+from pathlib import Path
+
+import pandas as pd
+
+from ARC_new import MediaStoryKeywordSearcher
+
+HITS = [
+    ('CNN', 'Professor accused', 'https://x.test/1', 'Mon, 01 Jul 2024 12:00:00 +0000',
+     'Summary, with "quotes"...', ['Accused'], ['William Smith', 'Jane Doe']),
+    ('Fox News', 'Protest at campus', 'https://x.test/2', 'Unknown', 'Protest...', ['Protest', 'Arrested'], []),
+    ('CNN', 'Arrested after protest', 'https://x.test/3', 'Tue, 02 Jul 2024 08:00:00 +0000', '...',
+     ['Arrested', 'Protest'], ['Jane Doe']),
+]
+FIELDS = ('source', 'title', 'url', 'published', 'summary', 'keywords_found', 'contacts_mentioned')
+
+
+def _searcher():
+    searcher = MediaStoryKeywordSearcher()
+    for hit in HITS:
+        searcher._add_result(*hit)
+    return searcher
+
+
+def test_records_read_like_result_dicts():
+    searcher = _searcher()
+    records = [record for articles in searcher.search_results.values() for record in articles]
+    assert [{field: record[field] for field in FIELDS} for record in records] == \
+        [dict(zip(FIELDS, hit)) for hit in (HITS[0], HITS[2], HITS[1])]
+    assert records[0].get('missing', 'default') == 'default'
+
+    # contact_mentions index the one article table instead of copying hits
+    assert {name: [record['url'] for record in searcher.mentions_of(name)] for name in searcher.contact_mentions} == \
+        {'William Smith': ['https://x.test/1'], 'Jane Doe': ['https://x.test/1', 'https://x.test/3']}
+    assert searcher.mentions_of('Jane Doe')[0] is records[0]
+
+
+def test_csv_export_matches_the_dict_based_export(tmp_path):
+    searcher = _searcher()
+    prefix = str(tmp_path / 'results')
+    searcher.export_search_results(prefix, xlsx=False)
+
+    # The rows the export built from per-article dicts before records were introduced
+    rows = [{
+        'source': source,
+        'title': article['title'],
+        'url': article['url'],
+        'published': article['published'],
+        'summary': article['summary'],
+        'keywords_found': ', '.join(article['keywords_found']),
+        'contacts_mentioned': ', '.join(article['contacts_mentioned']),
+        'num_keywords': len(article['keywords_found']),
+        'has_contact_mention': len(article['contacts_mentioned']) > 0
+    } for source, articles in searcher.search_results.items() for article in articles]
+    expected = tmp_path / 'expected.csv'
+    pd.DataFrame(rows).to_csv(expected, index=False)
+    assert Path(f'{prefix}.csv').read_text(encoding='utf-8') == expected.read_text(encoding='utf-8')
+
+
+def test_dashboard_counts_contact_mentions_per_article(tmp_path):
+    dashboard = _searcher().create_keyword_dashboard_data(str(tmp_path / 'dashboard.json'))
+    assert dashboard['summary']['total_contact_mentions'] == 3
+    assert dashboard['contact_visibility']['Jane Doe']['mention_count'] == 2
+    assert dashboard['keyword_metrics']['Arrested']['count'] == 2
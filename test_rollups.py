@@ -0,0 +1,63 @@
+"""Dashboard windows served from the time rollups"""
+from datetime import datetime, timedelta, timezone
+
+from ARC_new import MediaStoryKeywordSearcher, _utc_now
+
+
+def _entries(*days_ago):
+    now = _utc_now()
+    return [{'id': str(i), 'title': f'Arrested in story {i}', 'link': f'https://x.test/{i}', 'summary': '',
+             'published_parsed': tuple((now - timedelta(days=days)).utctimetuple())}
+            for i, days in enumerate(days_ago)]
+
+
+def test_store_rollups_cover_windows_past_the_loaded_results(tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.enable_article_store(str(tmp_path / 'articles.db'))
+    searcher._process_entries('Test', _entries(1, 30, 60), datetime.min)
+    searcher.load_results_from_store(days_back=7)
+
+    windows = searcher.create_keyword_dashboard_data(str(tmp_path / 'dashboard.json'))['windows']
+    assert searcher.aggregates.total_articles == 1
+    assert windows['7d']['articles'] == 1
+    assert windows['90d']['articles'] == 3
+    assert windows['90d']['sources'] == {'Test': 3}
+
+    # A store written before the rollups existed is rolled up when opened
+    searcher.article_store.conn.execute('DROP TABLE rollups')
+    searcher.article_store.conn.execute("DELETE FROM store_meta WHERE key = 'rollups'")
+    searcher.article_store.conn.commit()
+    searcher.enable_article_store(str(tmp_path / 'articles.db'))
+    searcher.load_results_from_store(days_back=7)
+    reopened = searcher.create_keyword_dashboard_data(str(tmp_path / 'dashboard.json'))['windows']
+    assert [w['articles'] for w in reopened.values()] == [w['articles'] for w in windows.values()]
+
+
+def test_windows_past_the_results_cutoff_are_cut_short(tmp_path, capsys):
+    searcher = MediaStoryKeywordSearcher()
+    searcher._process_entries('Test', _entries(1, 5), datetime.min)
+    searcher.results_since = _utc_now() - timedelta(days=7)
+
+    windows = searcher.create_keyword_dashboard_data(str(tmp_path / 'dashboard.json'))['windows']
+    assert windows['90d']['articles'] == 2
+    start = datetime.fromisoformat(windows['90d']['start']).replace(tzinfo=None)
+    assert start >= _utc_now() - timedelta(days=8)
+    assert 'Dashboard window 90d is longer than the results cover' in capsys.readouterr().out
+
+
+def test_rfc822_dates_land_in_their_utc_day():
+    searcher = MediaStoryKeywordSearcher()
+    entries = [{'id': str(i), 'title': 'Professor arrested', 'link': f'https://x.test/{i}', 'summary': '',
+                'published': published}
+               for i, published in enumerate(['Mon, 01 Jul 2024 23:30:00 -0500',   # 2 July, 04:30 UTC
+                                              'Tue, 02 Jul 2024 01:00:00 +0200',   # 1 July, 23:00 UTC
+                                              'Tue, 02 Jul 2024 12:00:00 GMT',
+                                              'Unknown'])]
+    searcher._process_entries('Test', entries, datetime.min)
+
+    stats = searcher.aggregates
+    assert stats.timeline() == {'2024-07-01': {'Arrested': 1}, '2024-07-02': {'Arrested': 2}}
+    assert stats.undated_articles == 1
+    july_2 = datetime(2024, 7, 2, tzinfo=timezone.utc).timestamp()
+    assert stats.daily.buckets[july_2]['articles'] == 2
+    assert sorted(stats.hourly.buckets) == [july_2 - 3600, july_2 + 4 * 3600, july_2 + 12 * 3600]
@@ -0,0 +1,40 @@
+"""Watch mode: the polling loop around the searcher"""
+import json
+from datetime import timedelta
+
+import pytest
+
+import ARC_new
+from ARC_new import MediaStoryKeywordSearcher, MediaWatchService, main
+
+
+def test_watch_drops_hits_that_leave_the_window(stub_feeds, tmp_path, monkeypatch):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.media_sources = stub_feeds
+    searcher.enable_article_store(str(tmp_path / 'articles.db'))
+    dashboard = tmp_path / 'dashboard.json'
+    service = MediaWatchService(searcher, days_back=7, report_path=None, export_prefix=None,
+                                dashboard_path=str(dashboard), metrics_path=None)
+
+    assert service.run_once() > 0
+    assert json.loads(dashboard.read_text())['summary']['total_articles'] == searcher.aggregates.total_articles > 0
+
+    # Nothing is due on the next cycle, but a month later every hit has aged out
+    later = ARC_new._utc_now() + timedelta(days=30)
+    monkeypatch.setattr(ARC_new, '_utc_now', lambda: later)
+    assert service.run_once() == 0
+    assert searcher.aggregates.total_articles == 0
+    assert json.loads(dashboard.read_text())['summary']['total_articles'] == 0
+
+
+def test_watch_requires_the_article_store(stub_feeds):
+    searcher = MediaStoryKeywordSearcher()
+    searcher.media_sources = stub_feeds
+    service = MediaWatchService(searcher, report_path=None, export_prefix=None, dashboard_path=None,
+                                metrics_path=None)
+    with pytest.raises(ValueError):
+        service.run_once()
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(['watch', '--no-store'])
+    assert exit_info.value.code == 2
@@ -0,0 +1,22 @@
+"""The rate-limited news search backend"""
+import pytest
+
+from ARC_new import MediaStoryKeywordSearcher, SearchProvider, StubSearchProvider, _search_entry
+
+
+def test_web_search_pages_up_to_budget(tmp_path):
+    searcher = MediaStoryKeywordSearcher()
+    entries = [_search_entry(f'Sexual harassment story {i}', f'https://x.test/{i}', None, '') for i in range(25)]
+    provider = StubSearchProvider(entries, page_size=10)
+    searcher.enable_web_search(provider, str(tmp_path / 'cache.db'), max_pages=2)
+
+    # Each query matching the 25 entries reads two pages of 10 and reports the other 5 as missed
+    assert searcher.search_web() == 20
+    counters = {name: value for (name, _), value in searcher.metrics.counters.items()}
+    assert counters['web_search_truncated'] >= 1
+    assert counters['web_search_results_missed'] == 5 * counters['web_search_truncated']
+
+
+def test_search_provider_is_abstract():
+    with pytest.raises(TypeError):
+        SearchProvider()